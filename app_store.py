@@ -0,0 +1,125 @@
+import sqlite3
+import json
+import os
+from datetime import datetime
+
+# --- 앱 단위 영구 저장소 (SQLite) ---
+# 검색 결과에서 본 앱의 출시일/리뷰/평가와 지역별 가격, appdetails 결과를 app_id 기준으로 보관한다.
+# 크롤링은 매번 창 안의 검색 행을 모두 새로 기록하고, 새로 봤거나 오래된 앱의 상세 정보만 다시 받는다.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS apps (
+    app_id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    release_date TEXT NOT NULL,
+    date_text TEXT NOT NULL,
+    img TEXT NOT NULL,
+    reviews INTEGER NOT NULL,
+    rating INTEGER NOT NULL,
+    details TEXT,
+    details_at TEXT,
+    last_seen TEXT NOT NULL,
+    tag_ids TEXT
+);
+CREATE TABLE IF NOT EXISTS prices (
+    app_id INTEGER NOT NULL,
+    cc TEXT NOT NULL,
+    price_val REAL NOT NULL,
+    price_str TEXT NOT NULL,
+    PRIMARY KEY (app_id, cc)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS apps_release ON apps (release_date);
+"""
+
+class AppStore:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        # tag_ids 가 생기기 전에 만든 저장소: 열만 더한다 (다음 크롤링 때 채워진다)
+        if "tag_ids" not in {r[1] for r in self.conn.execute("PRAGMA table_info(apps)")}:
+            self.conn.execute("ALTER TABLE apps ADD COLUMN tag_ids TEXT")
+
+    def __enter__(self): return self
+
+    def __exit__(self, *exc):
+        self.conn.commit()
+        self.conn.close()
+
+    def commit(self):
+        self.conn.commit()
+
+    def known(self, app_id, cc):
+        return self.conn.execute("SELECT 1 FROM prices WHERE app_id = ? AND cc = ?", (app_id, cc)).fetchone() is not None
+
+    def upsert_row(self, app_id, cc, title, release_date, date_text, img, reviews, rating, price_val, price_str, tag_ids=()):
+        now = datetime.now().isoformat(timespec="seconds")
+        self.conn.execute("""
+            INSERT INTO apps (app_id, title, release_date, date_text, img, reviews, rating, last_seen, tag_ids)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (app_id) DO UPDATE SET
+                details = CASE WHEN apps.title = excluded.title THEN apps.details END,
+                title = excluded.title, release_date = excluded.release_date, date_text = excluded.date_text,
+                img = excluded.img, reviews = excluded.reviews, rating = excluded.rating, last_seen = excluded.last_seen,
+                tag_ids = excluded.tag_ids
+        """, (app_id, title, release_date.strftime("%Y-%m-%d"), date_text, img, reviews, rating, now, json.dumps(list(tag_ids))))
+        self.set_price(app_id, cc, price_val, price_str)
+
+    def set_price(self, app_id, cc, price_val, price_str):
+        self.conn.execute("INSERT OR REPLACE INTO prices (app_id, cc, price_val, price_str) VALUES (?, ?, ?, ?)",
+                          (app_id, cc, price_val, price_str))
+
+    def window_apps(self, since, min_reviews, max_reviews, limit):
+        # 지역과 무관한 조건(출시일, 리뷰 수)만 만족하는 app_id, 최신 출시순
+        return [r[0] for r in self.conn.execute("""
+            SELECT app_id FROM apps WHERE release_date >= ? AND reviews BETWEEN ? AND ?
+            ORDER BY release_date DESC, app_id DESC LIMIT ?
+        """, (since.strftime("%Y-%m-%d"), min_reviews, max_reviews, limit))]
+
+    def candidates(self, cc, since, min_reviews, max_reviews, limit):
+        # 창 안에 있고 리뷰 수/가격 조건을 만족하는 앱, 최신 출시순
+        return self.conn.execute("""
+            SELECT a.*, p.price_val, p.price_str FROM apps a JOIN prices p ON p.app_id = a.app_id AND p.cc = ?
+            WHERE a.release_date >= ? AND a.reviews BETWEEN ? AND ? AND p.price_val > 0
+            ORDER BY a.release_date DESC, a.app_id DESC LIMIT ?
+        """, (cc, since.strftime("%Y-%m-%d"), min_reviews, max_reviews, limit)).fetchall()
+
+    def app(self, app_id):
+        return self.conn.execute("SELECT * FROM apps WHERE app_id = ?", (app_id,)).fetchone()
+
+    def needs_details(self, row, ttl_days):
+        if not row["details"] or not row["details_at"]: return True
+        return (datetime.now() - datetime.fromisoformat(row["details_at"])).days >= ttl_days
+
+    def set_details(self, app_id, details):
+        self.conn.execute("UPDATE apps SET details = ?, details_at = ? WHERE app_id = ?",
+                          (json.dumps(details, ensure_ascii=False), datetime.now().isoformat(timespec="seconds"), app_id))
+
+    def age_out(self, since):
+        # 창을 벗어난 앱은 지운다
+        cutoff = since.strftime("%Y-%m-%d")
+        self.conn.execute("DELETE FROM prices WHERE app_id IN (SELECT app_id FROM apps WHERE release_date < ?)", (cutoff,))
+        self.conn.execute("DELETE FROM apps WHERE release_date < ?", (cutoff,))
+
+    def checkpoint(self, cc):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (f"checkpoint_{cc}",)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_checkpoint(self, cc, data):
+        # 끊긴 크롤링이 어디까지 받았는지 남긴다. None 이면 지운다
+        if data is None:
+            self.conn.execute("DELETE FROM meta WHERE key = ?", (f"checkpoint_{cc}",))
+        else:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (f"checkpoint_{cc}", json.dumps(data)))
+
+    def mark_crawled(self, cc, complete):
+        # 마지막으로 창 끝까지 훑은 시각 (끊긴 크롤링이면 지운다)
+        if complete:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (f"crawled_{cc}", datetime.now().isoformat(timespec="seconds")))
+        else:
+            self.conn.execute("DELETE FROM meta WHERE key = ?", (f"crawled_{cc}",))
+        self.conn.commit()
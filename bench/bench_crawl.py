@@ -0,0 +1,86 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import crawler
+import search_parser
+from image_cache import ImageCache
+from standin import start_standin
+
+# --- 크롤링 종단 벤치마크 ---
+# 오프라인 대역 서버를 띄우고 실제 크롤러를 그대로 돌려서
+# 시나리오별 소요 시간, 요청 수, 전송 바이트, 최대 메모리를 잰다. 네트워크가 없어도 돈다.
+#   python bench/bench_crawl.py --latency 0.05 --jitter 0.02 [--json bench_output.json]
+REGIONS = [("kr", "₩"), ("us", "$"), ("jp", "¥")]
+
+def run_scenario(steam, name, fn):
+    steam.reset_counters()
+    tracemalloc.start()
+    t = time.perf_counter()
+    with redirect_stdout(io.StringIO()): result = fn()
+    wall = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    games = sum(len(g) for g in result.values()) if isinstance(result, dict) else len(result)
+    return {"scenario": name, "wall_s": round(wall, 3), "games": games, "requests": steam.counters["requests"],
+            "search": steam.counters["search"], "appdetails": steam.counters["appdetails"], "cdn": steam.counters["cdn"],
+            "errors": steam.counters["errors"], "bytes": steam.counters["bytes"], "peak_mem_kb": peak // 1024}
+
+def throttled(steam, fn, throttle_rate=0.1, error_rate=0.05):
+    # 429 와 503 을 섞어 내보내는 동안 fn 을 돌린다
+    saved = steam.throttle_rate, steam.error_rate
+    steam.throttle_rate, steam.error_rate = throttle_rate, error_rate
+    try: return fn()
+    finally: steam.throttle_rate, steam.error_rate = saved
+
+def use_cache_dir(path):
+    crawler.IMAGES = ImageCache(os.path.join(path, "images"), crawler.IMAGE_CACHE_BYTES)
+    return os.path.join(path, "apps.sqlite3")
+
+def main():
+    ap = argparse.ArgumentParser(description="크롤링 종단 벤치마크 (오프라인)")
+    ap.add_argument("--pages", type=int, default=20)
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--jitter", type=float, default=0.02)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--throttle-rate", type=float, default=0.0)
+    ap.add_argument("--json", help="결과를 JSON 파일로도 저장")
+    args = ap.parse_args()
+
+    steam, server, base_url = start_standin(pages=args.pages, latency=args.latency, jitter=args.jitter,
+                                            error_rate=args.error_rate, throttle_rate=args.throttle_rate)
+    crawler.STORE_URL = base_url
+    search_parser.CDN_URL = f"{base_url}/cdn"
+    quiet = lambda msg: None
+    results = []
+    tmp = tempfile.mkdtemp(prefix="hunter-bench-")
+    try:
+        db = use_cache_dir(os.path.join(tmp, "single"))
+        results.append(run_scenario(steam, "cold", lambda: crawler.fetch_steam_hidden_gems("kr", "₩", progress=quiet, db_path=db)))
+        results.append(run_scenario(steam, "warm-cache", lambda: crawler.fetch_steam_hidden_gems("kr", "₩", progress=quiet, db_path=db)))
+        db = use_cache_dir(os.path.join(tmp, "lazy"))
+        results.append(run_scenario(steam, "cold-lazy", lambda: crawler.fetch_steam_hidden_gems("kr", "₩", progress=quiet, db_path=db, lazy=True)))
+        db = use_cache_dir(os.path.join(tmp, "throttled"))
+        results.append(run_scenario(steam, "cold-throttled", lambda: throttled(steam, lambda: crawler.fetch_steam_hidden_gems("kr", "₩", progress=quiet, db_path=db))))
+        db = use_cache_dir(os.path.join(tmp, "multi"))
+        results.append(run_scenario(steam, "multi-region", lambda: crawler.fetch_all_regions(REGIONS, progress=quiet, db_path=db)))
+    finally:
+        server.shutdown()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    cols = ["scenario", "wall_s", "games", "requests", "search", "appdetails", "cdn", "errors", "bytes", "peak_mem_kb"]
+    print("".join(f"{c:>13}" for c in cols))
+    for r in results: print("".join(f"{r[c]:>13}" for c in cols))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f: json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import os
+import re
+import sys
+import json
+import time
+from datetime import datetime
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from search_parser import parse_search_rows, parse_date, parse_price
+
+# --- 검색 결과 파서 벤치마크 ---
+# 저장된 한국/미국/일본 검색 결과 페이지로 기존 BeautifulSoup 경로와 새 추출기를 비교한다.
+# 두 경로의 결과가 다르면 실패한다.
+#   python bench/bench_parser.py [반복 횟수]
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+REGIONS = {"kr": "₩", "us": "$", "jp": "¥"}
+
+# --- 기존 경로 (비교 기준) ---
+def legacy_parse_date(date_str):
+    try: return datetime.strptime(re.sub(r'[년월일.\s]+', '-', date_str.strip()).strip('-'), "%Y-%m-%d")
+    except: pass
+    try: return datetime.strptime(date_str.replace(',', ''), "%b %d %Y")
+    except: pass
+    try: return datetime.strptime(date_str.replace(',', ''), "%d %b %Y")
+    except: return None
+
+def legacy_parse_rows(results_html, currency):
+    rows = []
+    soup = BeautifulSoup(results_html, 'html.parser')
+    for row in soup.select('a.search_result_row'):
+        title = row.select_one('.title').text.strip()
+        app_id_match = re.search(r'/app/(\d+)', row.get('href', ''))
+        if not app_id_match: continue
+        app_id = app_id_match.group(1)
+        date_elem = row.select_one('.search_released')
+        if not date_elem: continue
+        game_date = legacy_parse_date(date_elem.text.strip())
+        if not game_date: continue
+        review_elem = row.select_one('.search_review_summary')
+        if not review_elem: continue
+        match = re.search(r'([\d,]+)', review_elem.get('data-tooltip-html', ''))
+        if not match: continue
+        img_tag = row.select_one('img')
+        img_src = ""
+        if img_tag:
+            srcset = img_tag.get('srcset', '')
+            if srcset:
+                img_src = srcset.split(',')[0].strip().split(' ')[0]
+            if not img_src or len(img_src) < 10:
+                img_src = img_tag.get('src', '')
+        if not img_src or len(img_src) < 10 or 'blank' in img_src:
+            img_src = f"https://shared.akamai.steamstatic.com/store_item_assets/steam/apps/{app_id}/header.jpg"
+        price_elem = row.select_one('.discount_final_price') or row.select_one('.search_price')
+        raw_price = price_elem.text.strip() if price_elem else f"{currency}0"
+        price_val, price_str = parse_price(raw_price, currency)
+        rating_match = re.search(r'(\d+)%', review_elem.get('data-tooltip-html', ''))
+        rows.append({
+            "app_id": int(app_id), "title": title,
+            "date_text": date_elem.text.strip(), "release_date": game_date,
+            "reviews": int(match.group(1).replace(',', '')),
+            "rating": int(rating_match.group(1)) if rating_match else 0,
+            "price_val": price_val, "price_str": price_str, "img": img_src,
+            "tag_ids": list(dict.fromkeys(json.loads(row.get('data-ds-tagids', '[]')))),  # 비교용: 새 파서가 더 뽑는 필드
+        })
+    return rows
+
+def fast_parse_rows(results_html, currency):
+    return list(parse_search_rows(results_html, currency))
+
+def load_fixture(cc):
+    with open(os.path.join(FIXTURE_DIR, f"search_{cc}.json"), "r", encoding="utf-8") as f:
+        return json.load(f)["results_html"]
+
+def bench(fn, html, currency, rounds):
+    t = time.perf_counter()
+    for _ in range(rounds): fn(html, currency)
+    return (time.perf_counter() - t) / rounds * 1000
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'region':<8}{'rows':>6}{'bs4 ms':>10}{'fast ms':>10}{'speedup':>10}")
+    for cc, currency in REGIONS.items():
+        html = load_fixture(cc)
+        expected = legacy_parse_rows(html, currency)
+        actual = fast_parse_rows(html, currency)
+        if actual != expected:
+            diff = next(i for i, (a, b) in enumerate(zip(actual, expected)) if a != b) if len(actual) == len(expected) else "개수"
+            sys.exit(f"[{cc}] 결과 불일치 (행 {diff})")
+        parse_date.cache_clear()
+        slow = bench(legacy_parse_rows, html, currency, rounds)
+        fast = bench(fast_parse_rows, html, currency, rounds)
+        print(f"{cc:<8}{len(actual):>6}{slow:>10.2f}{fast:>10.2f}{slow / fast:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
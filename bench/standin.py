@@ -0,0 +1,164 @@
+import os
+import io
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from PIL import Image
+
+# --- 오프라인 스팀 대역 서버 ---
+# 저장해 둔 /search/results/ 와 /api/appdetails 응답을 다시 내보낸다.
+# 검색 행은 오늘 날짜 기준으로 출시일을 다시 매기고 페이지마다 app_id 를 새로 붙여서
+# 원하는 페이지 수만큼 이어지게 만든다. 이미지 주소는 모두 이 서버의 /cdn/ 으로 바꾼다.
+#   python bench/standin.py --port 8765 --latency 0.05 --error-rate 0.02
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CDN_RE = re.compile(r'https://shared\.akamai\.steamstatic\.com')
+ROW_RE = re.compile(r'<a\s.*?</a>', re.S)
+APP_RE = re.compile(r'(/app/|data-ds-appid="|App_|/apps/|&quot;id&quot;:)\d+')
+RELEASED_RE = re.compile(r'(search_released[^>]*>)[^<]*(<)')
+PRICES = {"kr": ("KRW", "₩ {:,}", 1), "us": ("USD", "${:,.2f}", 100), "jp": ("JPY", "¥ {:,}", 1)}
+IMAGE_SIZES = {"header": (460, 215), "600x338": (600, 338), "1920x1080": (1920, 1080), "capsule": (231, 87)}
+
+def load_json(name):
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+class StandinSteam:
+    def __init__(self, pages=20, rows_per_day=3, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0, retry_after=1, seed=0):
+        self.pages = pages
+        self.rows_per_day = rows_per_day
+        self.latency, self.jitter = latency, jitter
+        self.error_rate, self.throttle_rate, self.retry_after = error_rate, throttle_rate, retry_after
+        self.rnd = random.Random(seed)
+        self.lock = threading.Lock()
+        self.rows = {cc: ROW_RE.findall(load_json(f"search_{cc}.json")["results_html"]) for cc in PRICES}
+        self.details = next(iter(load_json("appdetails.json").values()))["data"]
+        self.images = {}
+        self.base_url = ""
+        self.reset_counters()
+
+    def reset_counters(self):
+        with self.lock:
+            self.counters = {"requests": 0, "bytes": 0, "search": 0, "appdetails": 0, "cdn": 0, "errors": 0}
+
+    def count(self, route, size, error=False):
+        with self.lock:
+            self.counters["requests"] += 1
+            self.counters["bytes"] += size
+            self.counters[route] += 1
+            if error: self.counters["errors"] += 1
+
+    def app_id(self, n):
+        return 3000000 + n
+
+    def search_page(self, cc, start, count):
+        # n 번째 행: 오늘에서 n // rows_per_day 일 전 출시, app_id 는 n 으로 정한다
+        rows = self.rows.get(cc, self.rows["kr"])
+        today = datetime.now()
+        out = []
+        for n in range(start, min(start + count, self.pages * count)):
+            d = today - timedelta(days=n // self.rows_per_day)
+            row = APP_RE.sub(lambda m: f"{m.group(1)}{self.app_id(n)}", rows[n % len(rows)])
+            if "출시 예정" not in row:
+                row = RELEASED_RE.sub(lambda m: f"{m.group(1)}{d.year}년 {d.month}월 {d.day}일{m.group(2)}", row)
+            out.append(CDN_RE.sub(f"{self.base_url}/cdn", row))
+        return {"success": 1, "results_html": "\r\n".join(out), "total_count": self.pages * count, "start": start}
+
+    def appdetails(self, app_ids, cc, filters):
+        currency, fmt, scale = PRICES.get(cc, PRICES["kr"])
+        out = {}
+        for app_id in app_ids:
+            n = int(app_id) - 3000000
+            price = [5500, 11000, 16500, 21500][n % 4] if cc == "kr" else [4.99, 9.99, 14.99, 19.99][n % 4] if cc == "us" else [520, 1200, 1800, 2300][n % 4]
+            overview = {"currency": currency, "initial": int(price * scale), "final": int(price * scale), "discount_percent": 0,
+                        "initial_formatted": "", "final_formatted": fmt.format(price)}
+            if filters == "price_overview":
+                out[app_id] = {"success": True, "data": {"price_overview": overview}}
+            else:
+                data = json.loads(CDN_RE.sub(f"{self.base_url}/cdn", json.dumps(self.details, ensure_ascii=False)).replace("3295676", str(app_id)))
+                data.update(steam_appid=int(app_id), price_overview=overview)
+                out[app_id] = {"success": True, "data": data}
+        return out
+
+    def image(self, path):
+        kind = next((k for k in IMAGE_SIZES if k in path), "capsule")
+        with self.lock:
+            if kind not in self.images:
+                buf = io.BytesIO()
+                Image.effect_noise(IMAGE_SIZES[kind], 40).convert("RGB").save(buf, "JPEG", quality=85)
+                self.images[kind] = buf.getvalue()
+            return self.images[kind]
+
+def make_handler(steam):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args): pass
+
+        def send(self, status, body, content_type, route, headers=()):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in headers: self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+            steam.count(route, len(body), error=status >= 400)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            q = {k: v[0] for k, v in parse_qs(url.query).items()}
+            route = "search" if url.path.startswith("/search/results") else "appdetails" if url.path.startswith("/api/appdetails") else "cdn"
+            if steam.latency or steam.jitter:
+                time.sleep(max(0.0, steam.latency + steam.rnd.uniform(-steam.jitter, steam.jitter)))
+            if route != "cdn":
+                roll = steam.rnd.random()
+                if roll < steam.throttle_rate:
+                    return self.send(429, b"Too Many Requests", "text/plain", route, [("Retry-After", str(steam.retry_after))])
+                if roll < steam.throttle_rate + steam.error_rate:
+                    return self.send(503, b"Service Unavailable", "text/plain", route)
+            if route == "search":
+                body = steam.search_page(q.get("cc", "kr"), int(q.get("start", 0)), int(q.get("count", 25)))
+            elif route == "appdetails":
+                body = steam.appdetails(q.get("appids", "").split(","), q.get("cc", "kr"), q.get("filters"))
+            else:
+                return self.send(200, steam.image(url.path), "image/jpeg", route)
+            self.send(200, json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8", route)
+
+    return Handler
+
+def start_standin(port=0, **options):
+    # (steam, server, base_url) 을 돌려준다. server.shutdown() 으로 끈다
+    steam = StandinSteam(**options)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(steam))
+    server.daemon_threads = True
+    steam.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return steam, server, steam.base_url
+
+def main():
+    ap = argparse.ArgumentParser(description="오프라인 스팀 대역 서버")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--pages", type=int, default=20)
+    ap.add_argument("--latency", type=float, default=0.0)
+    ap.add_argument("--jitter", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0, help="5xx 비율")
+    ap.add_argument("--throttle-rate", type=float, default=0.0, help="429 비율")
+    ap.add_argument("--retry-after", type=int, default=1)
+    args = ap.parse_args()
+    steam, server, base_url = start_standin(args.port, pages=args.pages, latency=args.latency, jitter=args.jitter,
+                                            error_rate=args.error_rate, throttle_rate=args.throttle_rate, retry_after=args.retry_after)
+    print(f"대역 서버: {base_url}  (STEAM_STORE_URL={base_url} STEAM_CDN_URL={base_url}/cdn)")
+    try:
+        while True: time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import time
+import threading
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime
+from metrics import count
+
+# --- 공유 카탈로그 ---
+# 지역/날짜별 게임 풀을 프로세스에 한 벌만 두고 모든 세션이 읽기만 한다.
+# 세션은 게임을 복사하지 않고 덱(위치 배열), 커서, 보유 app_id 만 들고 있다.
+# 풀을 만들 때 가격대/평가 등급/출시 시기/태그별 색인과 점수를 한 번만 계산해 두고,
+# 덱은 이 색인에서 덱 크기만큼만 뽑는다 (풀 크기와 무관).
+GAME_FIELDS = ("app_id", "title", "price_str", "price_val", "img", "thumb", "reviews", "rating", "desc", "detail", "has_detail",
+               "released", "tag_ids")
+PRICE_BUCKETS = 4       # 가격대 구간 수 (풀 안의 가격 분위수로 나눈다)
+AGE_BOUNDS = (7, 14, 21)  # 출시 후 일수 구간 경계 (그 이상은 마지막 구간)
+TIER_MIN_RATINGS = (95, 80, 70, 40, 20, 0)  # 스팀 평가 등급별 최소 긍정 비율
+DECK_TAGS = 8           # 장르로 덱을 나눌 때 쓰는 상위 태그 수
+PARTIAL_RETRY_SEC = 60  # 덜 채운 카탈로그: 이만큼 지난 뒤 새 세션이 오면 캐시를 다시 읽거나 크롤링을 잇는다
+
+def rating_tier(rating):
+    return next(i for i, low in enumerate(TIER_MIN_RATINGS) if rating >= low)
+
+class CatalogGame:
+    __slots__ = GAME_FIELDS
+
+    def __init__(self, g, pos):
+        for k in GAME_FIELDS: object.__setattr__(self, k, g.get(k))
+        # 옛 캐시에서 app_id 를 못 찾은 게임은 위치로 만든 음수 ID 를 쓴다 (보유 목록 키가 겹치지 않게)
+        if self.app_id is None: object.__setattr__(self, "app_id", -(pos + 1))
+        if self.detail is not None: object.__setattr__(self, "detail", tuple(self.detail))
+        # has_detail 이 없는 캐시는 상세 정보를 크롤링 때 받은 것이다
+        if self.has_detail is None: object.__setattr__(self, "has_detail", True)
+        object.__setattr__(self, "tag_ids", tuple(self.tag_ids or ()))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("공유 카탈로그의 게임은 바꿀 수 없습니다")
+
+class Catalog:
+    __slots__ = ("cc", "date", "games", "by_id", "scores", "by_tag", "strata")
+
+    def __init__(self, cc, date_str, games):
+        self.cc, self.date = cc, date_str
+        self.games = tuple(CatalogGame(g, i) for i, g in enumerate(games))
+        self.by_id = {g.app_id: i for i, g in enumerate(self.games)}
+        self.scores = array("d", (g.price_val * (g.rating / 10) for g in self.games))
+        self.by_tag = defaultdict(list)
+        for i, g in enumerate(self.games):
+            for t in g.tag_ids: self.by_tag[t].append(i)
+        self.by_tag = {t: array("I", pos) for t, pos in self.by_tag.items()}
+        today = datetime.strptime(date_str, "%Y-%m-%d") if date_str else datetime.now()
+        def age(g):
+            days = (today - datetime.strptime(g.released, "%Y-%m-%d")).days if g.released else AGE_BOUNDS[-1] + 1
+            return bisect_right(AGE_BOUNDS, days)
+        n = len(self.games)
+        cheapest = sorted(range(n), key=lambda i: self.games[i].price_val)
+        top_tags = sorted(self.by_tag, key=lambda t: -len(self.by_tag[t]))[:DECK_TAGS]
+        # 덱 구성 방식 -> 구간 목록. 구간마다 (가격순 위치, 가격) 배열을 둬서 예산 컷을 이분 탐색한다
+        self.strata = {
+            "price": self._groups([cheapest[n * b // PRICE_BUCKETS:n * (b + 1) // PRICE_BUCKETS] for b in range(PRICE_BUCKETS)]),
+            "tier": self._groups(self._split(lambda g: rating_tier(g.rating))),
+            "age": self._groups(self._split(age)),
+            "tag": self._groups([self.by_tag[t] for t in top_tags]),
+        }
+
+    def _split(self, key):
+        groups = defaultdict(list)
+        for i, g in enumerate(self.games): groups[key(g)].append(i)
+        return [groups[k] for k in sorted(groups)]
+
+    def _groups(self, groups):
+        out = []
+        for pos in groups:
+            pos = sorted(pos, key=lambda i: self.games[i].price_val)
+            if pos: out.append((array("I", pos), array("d", (self.games[i].price_val for i in pos))))
+        return out
+
+    def __len__(self): return len(self.games)
+
+    def game(self, app_id): return self.games[self.by_id[app_id]]
+
+    def score(self, app_id): return self.scores[self.by_id[app_id]]
+
+    def deal(self, rng, size, budget, strata="price"):
+        # 구간을 돌아가며 예산 안의 게임을 하나씩 무작위로 뽑아 섞은 덱(위치 배열).
+        # 일은 덱 크기에 비례하고, 풀이 덱보다 작을 때만 남은 게임을 훑어 채운다.
+        groups = [(pos, bisect_right(prices, budget)) for pos, prices in self.strata.get(strata, self.strata["price"])]
+        groups = [(pos, cut) for pos, cut in groups if cut]
+        deck, seen = array("I"), set()
+        for attempt in range(size * 8 if groups else 0):
+            if len(deck) >= size: break
+            pos, cut = groups[attempt % len(groups)]
+            i = pos[rng.randrange(cut)]
+            if i not in seen: seen.add(i); deck.append(i)
+        if len(deck) < size:
+            rest = [i for i, g in enumerate(self.games) if i not in seen and g.price_val <= budget]
+            rng.shuffle(rest)
+            deck.extend(rest[:size - len(deck)])
+        # 예산 안에 드는 게임이 하나도 없으면 예산을 무시한다
+        if not deck and self.games and budget != float("inf"): return self.deal(rng, size, float("inf"), strata)
+        rng.shuffle(deck)
+        return deck
+
+# --- 프로세스 공유 카탈로그 캐시 ---
+# 모든 Streamlit 세션이 지역별 카탈로그를 한 벌만 공유한다.
+# 지역당 크롤링은 한 번에 하나만 돌고(single-flight), 나머지 세션은
+# 이전 데이터가 있으면 그것을 바로 받고, 없으면 진행 중인 크롤링 결과를 기다린다.
+class CatalogCache:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}   # cc -> Catalog
+        self.flights = {}   # cc -> 크롤링 중 잡고 있는 Lock
+        self.stale = set()  # 무효화된 지역 (다음 로드 때 파일 캐시를 무시하고 새로 크롤링)
+        self.partial = {}   # cc -> 덜 채운 (끊겼거나 백그라운드에서 채우는 중인) 카탈로그를 받은 시각
+
+    def _fresh(self, cc, date_str):
+        entry = self.entries.get(cc)
+        if cc in self.partial and time.monotonic() - self.partial[cc] > PARTIAL_RETRY_SEC: return None
+        if entry and entry.date == date_str and cc not in self.stale: return entry
+        return None
+
+    def get(self, cc, date_str, loader):
+        # loader(force) -> (games, from_cache, complete). (Catalog, from_cache) 를 돌려준다
+        with self.lock:
+            fresh = self._fresh(cc, date_str)
+            if fresh: count("catalog_memory_hit"); return fresh, True
+            previous = self.entries.get(cc)
+            flight = self.flights.setdefault(cc, threading.Lock())
+
+        if not flight.acquire(blocking=False):
+            if previous and previous.games: count("catalog_served_previous"); return previous, True
+            count("catalog_waited_for_crawl")
+            with flight: pass
+            return self.get(cc, date_str, loader)
+
+        try:
+            with self.lock:
+                fresh = self._fresh(cc, date_str)
+                if fresh: return fresh, True
+                force = cc in self.stale
+            count("catalog_memory_miss")
+            games, from_cache, complete = loader(force)
+            if not games:
+                # 크롤링 실패: 이전 데이터라도 있으면 그것으로 버틴다
+                with self.lock:
+                    if cc in self.partial: self.partial[cc] = time.monotonic()
+                return (previous, True) if previous else (Catalog(cc, date_str, []), from_cache)
+            catalog = Catalog(cc, date_str, games)
+            with self.lock:
+                self.entries[cc] = catalog
+                self.stale.discard(cc)
+                if complete: self.partial.pop(cc, None)
+                else: self.partial[cc] = time.monotonic()
+            return catalog, from_cache
+        finally:
+            flight.release()
+
+    def invalidate(self, cc):
+        # 파일은 지우지 않는다: 새 크롤링이 끝날 때까지 다른 세션은 기존 데이터를 계속 쓴다
+        with self.lock: self.stale.add(cc)
+
+CATALOG = CatalogCache()
@@ -0,0 +1,418 @@
+import requests
+from requests.adapters import HTTPAdapter
+import time
+import re
+import os
+import json
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from app_store import AppStore
+from image_cache import ImageCache
+from metrics import NULL_TRACE, count
+from search_parser import parse_search_rows, parse_date, parse_price
+
+# --- 크롤링 설정 ---
+# 대역 서버(bench/standin.py)로 돌릴 때는 STEAM_STORE_URL / STEAM_CDN_URL 로 바꾼다
+STORE_URL = os.environ.get("STEAM_STORE_URL", "https://store.steampowered.com")
+WINDOW_DAYS = 35        # 35일 이내 신작만
+MIN_REVIEWS, MAX_REVIEWS = 10, 2000
+POOL_SIZE = 400         # 지역별 후보 풀 크기 (세션마다 여기서 덱을 뽑는다)
+MAX_PAGES = 60
+PAGE_SIZE = 25
+SEARCH_RATE = 2.0       # 검색 페이지 초당 요청 수 (시작값)
+SEARCH_TIMEOUT = 10
+DETAIL_WORKERS = 4      # appdetails 동시 요청 수 (시작값)
+DETAIL_MAX_WORKERS = 8  # 응답이 좋을 때 늘려 갈 수 있는 최대 동시 요청 수
+DETAIL_RATE = 5.0       # appdetails 초당 요청 수 (시작값, 전체 워커 공유)
+DETAIL_TIMEOUT = 3      # 재시도할 때마다 이 값만큼 늘린다
+LATENCY_TARGET = 1.0    # 이보다 느린 응답이 오면 속도를 더 올리지 않는다 (초)
+RETRIES = 3             # 429/5xx/타임아웃 재시도 횟수
+BACKOFF_BASE, BACKOFF_MAX = 0.5, 30.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+DETAIL_TTL_DAYS = 7     # 저장된 상세 정보를 다시 받기까지의 기간
+PRICE_BATCH = 50        # price_overview 한 번에 묻는 appid 수
+PREFETCH_AHEAD = 3      # 지연 모드: 지금 게임 뒤로 미리 받아 둘 게임 수
+PREFETCH_KEEP = 2000    # 지연 모드: 기억해 둘 (cc, app_id) 상세 정보 수
+PREFETCH_RETRY_SEC = 300  # 지연 모드: 상세 정보를 못 받은 게임은 이만큼 지나야 다시 요청한다
+DETAIL_COMMIT = 20      # appdetails 를 이만큼 저장할 때마다 커밋한다 (저장소 쓰기 잠금을 오래 잡지 않게)
+
+# 실행 위치와 무관하게 이 파일 옆 cache/ 를 쓴다: cron 으로 만든 캐시를 앱이 그대로 읽는다
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.abspath(os.environ.get("STEAM_HUNTER_CACHE_DIR") or os.path.join(APP_DIR, "cache"))
+APP_DB_FILE = os.path.join(CACHE_DIR, "apps.sqlite3")
+
+IMAGE_DIR = os.path.join(CACHE_DIR, "images")
+IMAGE_CACHE_BYTES = 256 * 1024 * 1024   # 썸네일 디스크 캐시 상한
+IMAGE_TIMEOUT = 5
+THUMB_WIDTH = 320       # 인벤토리/게임 카드 헤더
+SHOT_THUMB_WIDTH = 400  # 3열 스크린샷 스트립
+SHOT_STRIP = 3
+
+COOKIES = {'Steam_Language': 'korean', 'birthtime': '0', 'lastagecheckage': '1-January-1990'}
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# --- HTTP 세션 (프로세스 공유, keep-alive 커넥션 풀) ---
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            s.headers.update(HEADERS)
+            s.cookies.update(COOKIES)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=DETAIL_MAX_WORKERS + 2)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _session = s
+        return _session
+
+IMAGES = ImageCache(IMAGE_DIR, IMAGE_CACHE_BYTES)
+
+class AdaptiveLimiter:
+    # 여러 스레드가 공유하는 AIMD 요청 제어기.
+    # 정상 응답이 LATENCY_TARGET 안에 오면 초당 요청 수와 동시 요청 수를 조금씩(덧셈) 올리고,
+    # 429/5xx/타임아웃이 오면 절반으로(곱셈) 줄인다. Retry-After 를 받으면 그때까지 모두 멈춘다.
+    def __init__(self, rate, concurrency=1, max_concurrency=None):
+        self.rate = rate
+        self.min_rate, self.max_rate = rate / 8, rate * 4
+        self.limit = float(concurrency)
+        self.max_limit = max_concurrency or concurrency
+        self.in_flight = 0
+        self.next_t = 0.0
+        self.pause_until = 0.0
+        self.cond = threading.Condition()
+
+    def acquire(self):
+        # 기다린 시간(초)을 돌려준다
+        t0 = time.monotonic()
+        with self.cond:
+            while self.in_flight >= int(self.limit): self.cond.wait()
+            self.in_flight += 1
+            now = time.monotonic()
+            t = max(now, self.next_t, self.pause_until)
+            self.next_t = t + 1.0 / self.rate
+        if t > now: time.sleep(t - now)
+        return time.monotonic() - t0
+
+    def release(self, ok, latency=0.0, retry_after=None):
+        with self.cond:
+            self.in_flight -= 1
+            if ok and latency <= LATENCY_TARGET:
+                self.rate = min(self.max_rate, self.rate + 1.0 / self.rate)
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            elif not ok:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.limit = max(1.0, self.limit / 2)
+                if retry_after: self.pause_until = max(self.pause_until, time.monotonic() + retry_after)
+            self.cond.notify_all()
+
+def retry_after_seconds(r):
+    # Retry-After 는 초 단위만 쓴다 (날짜 형식이면 무시하고 지수 백오프).
+    # BACKOFF_MAX 로 자른다: 공유 리미터 (PREFETCH.limiter) 가 몇 분씩 멈추지 않게
+    try: return min(BACKOFF_MAX, max(0.0, float(r.headers.get("Retry-After", ""))))
+    except ValueError: return None
+
+# --- 요청 ---
+def http_get(url, route, params=None, timeout=None, limiter=None, trace=NULL_TRACE, retries=RETRIES):
+    # 모든 요청이 지나가는 곳: 대기 시간, 지연, 오류/타임아웃을 트레이스에 남기고
+    # 429/5xx/타임아웃/연결 오류는 Retry-After 또는 흔들림을 준 지수 백오프 뒤에 다시 시도한다.
+    # 재시도가 다 떨어지면 마지막 응답을 돌려주거나 마지막 예외를 던진다.
+    for attempt in range(retries + 1):
+        if limiter: trace.add_time("rate_limit_wait", limiter.acquire())
+        trace.incr(f"requests_{route}")
+        r, error, retry_after = None, None, None
+        t = time.perf_counter()
+        try:
+            r = get_session().get(url, params=params, timeout=timeout and timeout * (attempt + 1))
+        except requests.Timeout as e:
+            trace.incr("timeouts"); error = e
+        except requests.RequestException as e:
+            trace.incr("request_errors"); error = e
+        latency = time.perf_counter() - t
+        trace.observe(route, latency)
+        if r is not None:
+            trace.incr("bytes", len(r.content))
+            if r.status_code >= 400: trace.incr(f"http_{r.status_code}")
+            if r.status_code == 429: retry_after = retry_after_seconds(r)
+        ok = r is not None and r.status_code not in RETRY_STATUS
+        if limiter: limiter.release(ok, latency, retry_after)
+        if ok or attempt == retries: break
+        trace.incr("retries")
+        backoff = retry_after if retry_after is not None else min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+        trace.add_time("retry_backoff", backoff)
+        time.sleep(backoff)
+    if r is None: raise error
+    return r
+
+def decode_json(r, trace=NULL_TRACE):
+    with trace.stage("json_decode"): return r.json()
+
+def fetch_search_page(cc, page, limiter=None, trace=NULL_TRACE):
+    params = {"query": "", "start": page*PAGE_SIZE, "count": PAGE_SIZE, "dynamic_data": "", "sort_by": "Released_DESC", "category1": "998", "infinite": "1", "cc": cc}
+    r = http_get(f"{STORE_URL}/search/results/", "search", params, SEARCH_TIMEOUT, limiter, trace)
+    return decode_json(r, trace).get('results_html', '')
+
+DEFAULT_DETAILS = {"full_desc": "설명 없음", "tags": "장르 미분류", "screenshots": [], "screenshot_thumbs": [], "header": ""}
+
+def get_game_details(app_id, cc, limiter=None, trace=NULL_TRACE):
+    # 실패하면 None (저장소에 기본값이 남지 않도록)
+    url = f"{STORE_URL}/api/appdetails"
+    try:
+        r = http_get(url, "appdetails", {"appids": app_id, "l": "korean", "cc": cc}, DETAIL_TIMEOUT, limiter, trace)
+        data = decode_json(r, trace)
+        if str(app_id) in data and data[str(app_id)]['success']:
+            gd = data[str(app_id)]['data']
+            desc = re.sub('<[^<]+?>', '', gd.get('short_description', '설명 없음'))
+            tags = ", ".join([g['description'] for g in gd.get('genres', [])])
+            shots = [s.get('path_full', '') for s in gd.get('screenshots', [])]
+            shot_thumbs = [s.get('path_thumbnail') or s.get('path_full', '') for s in gd.get('screenshots', [])]
+            return {"full_desc": desc, "tags": tags, "screenshots": shots, "screenshot_thumbs": shot_thumbs, "header": gd.get('header_image', '')}
+    except: pass
+    trace.incr("details_failed")
+    return None
+
+def download_image(url, trace=NULL_TRACE):
+    r = http_get(url, "image", timeout=IMAGE_TIMEOUT, trace=trace, retries=1)
+    r.raise_for_status()
+    return r.content
+
+def fetch_price_overviews(app_ids, cc, currency, limiter=None, trace=NULL_TRACE):
+    # appdetails 는 filters=price_overview 일 때만 여러 appid 를 한 번에 받는다.
+    # 지역에서 팔지 않거나 무료인 앱은 가격 0 으로 돌려준다 (후보에서 빠짐)
+    prices = {}
+    for i in range(0, len(app_ids), PRICE_BATCH):
+        chunk = app_ids[i:i + PRICE_BATCH]
+        try:
+            r = http_get(f"{STORE_URL}/api/appdetails", "price_overview", {"appids": ",".join(map(str, chunk)), "filters": "price_overview", "cc": cc}, DETAIL_TIMEOUT, limiter, trace)
+            data = decode_json(r, trace)
+        except: continue
+        for app_id in chunk:
+            entry = data.get(str(app_id)) or {}
+            overview = entry.get('data') if entry.get('success') else None
+            overview = overview.get('price_overview') if isinstance(overview, dict) else None
+            if overview and overview.get('final_formatted'):
+                prices[app_id] = parse_price(overview['final_formatted'], currency)
+            else:
+                prices[app_id] = (0.0, f"{currency}0")
+    return prices
+
+# --- 크롤링 함수 (이미지 복구 강화) ---
+def crawl_search(store, cc, currency, today, progress, trace=NULL_TRACE, page_limit=None):
+    # 검색 결과 페이지를 넘기며 창 안의 행을 저장소에 기록한다.
+    # page_limit: 이번에는 그만큼만 넘기고 체크포인트를 남긴다 (나머지는 다음 크롤링이 잇는다)
+    store.age_out(today - timedelta(days=WINDOW_DAYS))
+    # 창 전체를 매번 다시 훑는다 (페이지당 요청 한 번): 이미 아는 앱도 리뷰 수/평가/가격을 새로 기록해야
+    # 후보 조건이 지금 값으로 걸린다. 증분으로 아끼는 곳은 appdetails (needs_details) 쪽이다.
+
+    # 같은 날 재시도가 다 떨어져 끊긴 크롤링이 있으면 그 페이지부터 잇는다 (앞 페이지 행은 이미 저장소에 있다)
+    today_str = today.strftime("%Y-%m-%d")
+    checkpoint = store.checkpoint(cc)
+    page = checkpoint["page"] if checkpoint and checkpoint["date"] == today_str else 0
+    kept = checkpoint["kept"] if page else 0
+    if page: trace.incr("resumed_from_page", page)
+
+    # 검색 결과는 Released_DESC 정렬: N페이지를 파싱하는 동안 N+1페이지를 미리 받아 두고,
+    # 35일 창을 벗어난 행이 나오면 더 이상 페이지를 넘기지 않는다.
+    # 후보 풀 크기 (POOL_SIZE) 에서는 멈추지 않는다: 창 안의 행을 모두 새로 기록해야 풀이 지금 값으로 뽑힌다.
+    page_limiter = AdaptiveLimiter(SEARCH_RATE)
+    last = min(MAX_PAGES, page + page_limit) if page_limit else MAX_PAGES
+    complete = False
+    done = page
+    with ThreadPoolExecutor(max_workers=1) as pager:
+        next_page = pager.submit(fetch_search_page, cc, page, page_limiter, trace) if page < last else None
+        while next_page is not None:
+            progress(f"🔍 {page + 1}페이지 탐색 중... (확보: {kept}개)")
+            try:
+                with trace.stage("search_wait"): results_html = next_page.result()
+                page += 1
+                trace.incr("pages")
+                next_page = pager.submit(fetch_search_page, cc, page, page_limiter, trace) if page < last else None
+
+                if 'search_result_row' not in results_html: complete = True; break
+                with trace.stage("html_parse"): rows = list(parse_search_rows(results_html, currency))
+
+                past_window = False
+                new_rows = 0
+                with trace.stage("store_write"):
+                    for row in rows:
+                        trace.incr("rows_scanned")
+                        days_diff = (today - row["release_date"]).days
+                        if days_diff > WINDOW_DAYS: trace.incr("rows_dropped_date"); past_window = True; break
+                        if days_diff < 0: trace.incr("rows_dropped_date"); continue
+
+                        app_id = row["app_id"]
+                        if not store.known(app_id, cc): new_rows += 1
+                        store.upsert_row(app_id, cc, row["title"], row["release_date"], row["date_text"], row["img"], row["reviews"], row["rating"], row["price_val"], row["price_str"], row["tag_ids"])
+                        if not MIN_REVIEWS <= row["reviews"] <= MAX_REVIEWS: trace.incr("rows_dropped_reviews"); continue
+                        if row["price_val"] <= 0: trace.incr("rows_dropped_price"); continue
+                        print(f"  ★ [확보] {row['title']}")
+                        trace.incr("rows_kept")
+                        kept += 1
+                trace.incr("rows_new", new_rows)
+                store.commit()  # 페이지마다: 플레이 중인 프리페치가 잠긴 저장소를 기다리지 않게
+                done = page
+                if past_window:
+                    complete = True; break
+            except: trace.incr("search_aborted"); break
+        else: complete = last == MAX_PAGES  # MAX_PAGES까지 정상적으로 다 넘김 (page_limit 에서 멈췄으면 이어서 한다)
+        if next_page: next_page.cancel()
+    store.set_checkpoint(cc, None if complete else {"date": today_str, "page": done, "kept": kept})
+    store.mark_crawled(cc, complete)
+
+def fill_details(store, candidates, cc, progress, trace=NULL_TRACE):
+    # 새 앱이거나 상세 정보가 오래된 앱만 appdetails 를 다시 받는다
+    todo = list(dict.fromkeys(c["app_id"] for c in candidates if store.needs_details(c, DETAIL_TTL_DAYS)))
+    trace.incr("details_reused", len({c["app_id"] for c in candidates}) - len(todo))
+    progress(f"📥 상세 정보 수집 중... ({len(todo)}개)")
+    limiter = AdaptiveLimiter(DETAIL_RATE, DETAIL_WORKERS, DETAIL_MAX_WORKERS)
+    fetched = {}
+    with trace.stage("appdetails"), ThreadPoolExecutor(max_workers=DETAIL_MAX_WORKERS) as pool:
+        futures = [(app_id, pool.submit(get_game_details, app_id, cc, limiter, trace)) for app_id in todo]
+        for app_id, future in futures:
+            details = future.result()
+            if details:
+                store.set_details(app_id, details)
+                fetched[app_id] = details
+                if len(fetched) % DETAIL_COMMIT == 0: store.commit()
+    return fetched
+
+def build_games(candidates, fetched, today, lazy=False):
+    # lazy: 상세 정보를 받지 않은 크롤링. 저장소에도 없는 게임은 has_detail=False 로 두고 플레이 중에 받는다
+    games = []
+    for c in candidates:
+        stored = fetched.get(c["app_id"]) or (json.loads(c["details"]) if c["details"] else None)
+        details = {**DEFAULT_DETAILS, **(stored or {})}
+        days_diff = (today - datetime.strptime(c["release_date"], "%Y-%m-%d")).days
+        games.append({
+            "app_id": c["app_id"], "title": c["title"], "price_str": c["price_str"], "price_val": c["price_val"],
+            "img": c["img"],
+            "thumb": c["img"], # [KeyError 방지] thumb 키 명시적 추가
+            "reviews": c["reviews"], "rating": c["rating"],
+            "desc": f"{c['date_text']} 출시 ({days_diff}일 전)",
+            "released": c["release_date"], "tag_ids": json.loads(c["tag_ids"]) if c["tag_ids"] else [],
+            "full_desc": details["full_desc"], "tags": details["tags"], "screenshots": details["screenshots"],
+            "header": details["header"] or c["img"],
+            "shot_thumbs": details["screenshot_thumbs"][:SHOT_STRIP],
+            "has_detail": not lazy or stored is not None,
+        })
+    return games
+
+def make_thumbnails(header, shot_urls, trace=NULL_TRACE):
+    # (헤더 썸네일 또는 None, 스트립 썸네일 목록). 실패한 스크린샷은 원격 주소 그대로
+    fetch = lambda url: download_image(url, trace)
+    thumb = IMAGES.thumbnail(header, THUMB_WIDTH, fetch) if header else None
+    return thumb, [IMAGES.thumbnail(u, SHOT_THUMB_WIDTH, fetch) or u for u in shot_urls]
+
+def fill_images(games, progress, trace=NULL_TRACE):
+    # 헤더와 스트립용 스크린샷을 한 번만 받아 표시 폭으로 줄여 둔다 (실패하면 원격 주소 그대로).
+    # 원본 해상도 스크린샷은 갤러리를 열 때만 원격에서 받는다. 상세 정보가 없는 게임은 건너뛴다.
+    todo = [g for g in games if g["has_detail"]]
+    progress(f"🖼️ 썸네일 만드는 중... ({len(todo)}개)")
+    def work(game):
+        thumb, game["shot_thumbs"] = make_thumbnails(game["header"], game["shot_thumbs"], trace)
+        game["thumb"] = thumb or game["img"]
+    with trace.stage("images"), ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as pool:
+        list(pool.map(work, todo))
+    return games
+
+def fetch_steam_hidden_gems(cc, currency, progress=print, db_path=None, trace=NULL_TRACE, lazy=False, today=None, page_limit=None):
+    today = today or datetime.now()
+    since = today - timedelta(days=WINDOW_DAYS)
+    progress(f"🕵️ 스팀 탐색 시작... ({today.strftime('%Y-%m-%d')} 기준, 지역: {cc.upper()})")
+    with AppStore(db_path or APP_DB_FILE) as store:
+        with trace.stage("search"): crawl_search(store, cc, currency, today, progress, trace, page_limit)
+        # 후보는 저장소에서 고른다
+        candidates = store.candidates(cc, since, MIN_REVIEWS, MAX_REVIEWS, POOL_SIZE)
+        fetched = {} if lazy else fill_details(store, candidates, cc, progress, trace)
+    return fill_images(build_games(candidates, fetched, today, lazy), progress, trace)
+
+def fetch_all_regions(regions, progress=print, db_path=None, trace=NULL_TRACE, lazy=False, today=None, page_limit=None):
+    # 여러 지역을 한 번에: 검색 행과 설명/장르/스크린샷은 첫 지역에서 한 번만 받고,
+    # 나머지 지역은 price_overview 묶음 요청으로 가격만 받는다.
+    # regions: [(cc, currency), ...] (첫 항목이 기준 지역) -> {cc: games}
+    today = today or datetime.now()
+    since = today - timedelta(days=WINDOW_DAYS)
+    (base_cc, base_currency), others = regions[0], regions[1:]
+    progress(f"🕵️ 스팀 탐색 시작... ({today.strftime('%Y-%m-%d')} 기준, 지역: {', '.join(cc.upper() for cc, _ in regions)})")
+    with AppStore(db_path or APP_DB_FILE) as store:
+        with trace.stage("search"): crawl_search(store, base_cc, base_currency, today, progress, trace, page_limit)
+        # 지역마다 팔지 않는 앱이 있으니 여유 있게 묻는다
+        pool_ids = store.window_apps(since, MIN_REVIEWS, MAX_REVIEWS, POOL_SIZE * 2)
+        limiter = AdaptiveLimiter(DETAIL_RATE)
+        with trace.stage("price_overview"):
+            for cc, currency in others:
+                progress(f"💱 {cc.upper()} 가격 확인 중... ({len(pool_ids)}개)")
+                for app_id, (price_val, price_str) in fetch_price_overviews(pool_ids, cc, currency, limiter, trace).items():
+                    store.set_price(app_id, cc, price_val, price_str)
+                store.commit()
+
+        candidates = {cc: store.candidates(cc, since, MIN_REVIEWS, MAX_REVIEWS, POOL_SIZE) for cc, _ in regions}
+        fetched = {} if lazy else fill_details(store, [c for rows in candidates.values() for c in rows], base_cc, progress, trace)
+    # 지역끼리 겹치는 이미지는 이미 만든 썸네일을 그대로 쓴다
+    return {cc: fill_images(build_games(rows, fetched, today, lazy), progress, trace) for cc, rows in candidates.items()}
+
+# --- 플레이 중 상세 정보 미리 받기 (지연 모드) ---
+# 크롤링 때 건너뛴 상세 정보는 게임을 띄우기 직전에 받는다. (cc, app_id) 별 Future 를
+# 프로세스 전체가 공유하므로 여러 세션이 같은 게임을 봐도 요청은 한 번이다.
+# 결과는 캐시 파일의 상세 레코드와 같은 모양에 로컬 헤더 썸네일(thumb)을 더한 것이다.
+class DetailPrefetcher:
+    def __init__(self, workers=DETAIL_WORKERS, rate=DETAIL_RATE):
+        self.pool = ThreadPoolExecutor(max_workers=DETAIL_MAX_WORKERS, thread_name_prefix="prefetch")
+        self.limiter = AdaptiveLimiter(rate, workers, DETAIL_MAX_WORKERS)
+        self.lock = threading.Lock()
+        self.futures = {}   # (cc, app_id) -> Future
+        self.failed = {}    # 상세 정보를 못 받은 (cc, app_id) -> 실패 시각: 기본값을 보여 주고 PREFETCH_RETRY_SEC 뒤에 다시 받는다
+
+    def want(self, cc, app_ids):
+        with self.lock:
+            now = time.monotonic()
+            for app_id in app_ids:
+                key = (cc, app_id)
+                # 실패한 Future 도 남겨 둔다 (get 이 기본값을 돌려준다): rerun 마다 다시 요청하지 않는다
+                if key not in self.futures or now - self.failed.get(key, now) > PREFETCH_RETRY_SEC:
+                    self.failed.pop(key, None)
+                    self.futures[key] = self.pool.submit(self._load, cc, app_id)
+            if len(self.futures) > PREFETCH_KEEP:
+                for key in [k for k, f in self.futures.items() if f.done()][:len(self.futures) - PREFETCH_KEEP]:
+                    del self.futures[key]
+                    self.failed.pop(key, None)
+
+    def get(self, cc, app_id):
+        # 준비됐으면 상세 레코드, 아직이면 None
+        with self.lock: future = self.futures.get((cc, app_id))
+        return future.result() if future and future.done() else None
+
+    def forget(self, cc):
+        # 데이터 갱신 때: 실패해서 기본값으로 남은 것도 다시 받게 한다
+        with self.lock:
+            for key in [k for k in self.futures if k[0] == cc]: del self.futures[key]
+            self.failed = {k: t for k, t in self.failed.items() if k[0] != cc}
+
+    def _load(self, cc, app_id):
+        # 예외를 Future 에 남기지 않는다: 화면은 매 rerun 마다 get() 으로 결과를 다시 읽는다
+        details = None
+        try:
+            with AppStore(APP_DB_FILE) as store:
+                row = store.app(app_id)
+                details = json.loads(row["details"]) if row and not store.needs_details(row, DETAIL_TTL_DAYS) else None
+                if details: count("prefetch_reused")
+                else:
+                    details = get_game_details(app_id, cc, self.limiter)
+                    count("prefetch_fetched" if details else "prefetch_failed")
+                    if details and row: store.set_details(app_id, details)
+        except Exception:
+            # 크롤링이 저장소를 잡고 있어도 (database is locked) 받은 상세 정보는 그대로 보여 준다
+            count("prefetch_error")
+        if not details:
+            with self.lock: self.failed[(cc, app_id)] = time.monotonic()
+        details = {**DEFAULT_DETAILS, **(details or {})}
+        try: thumb, shot_thumbs = make_thumbnails(details["header"], details["screenshot_thumbs"][:SHOT_STRIP])
+        except Exception: thumb, shot_thumbs = None, details["screenshot_thumbs"][:SHOT_STRIP]
+        return {"full_desc": details["full_desc"], "tags": details["tags"], "screenshots": details["screenshots"],
+                "shot_thumbs": shot_thumbs, "thumb": thumb}
+
+PREFETCH = DetailPrefetcher()
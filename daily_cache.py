@@ -0,0 +1,168 @@
+import os
+import sys
+import time
+import argparse
+import threading
+from datetime import datetime, timedelta, time as dtime
+from app_store import AppStore
+from crawler import fetch_steam_hidden_gems, fetch_all_regions, APP_DIR, CACHE_DIR, APP_DB_FILE
+from game_cache import load_index, write_cache
+from metrics import CrawlTrace, count, publish
+
+# --- 날짜별 게임 캐시 만들기 (Streamlit 없이) ---
+# 앱(main.py)과 명령줄이 같이 쓴다. 캐시 파일은 날짜별로 따로 두므로 자정 전에 다음 날 것을
+# 미리 만들어 둘 수 있고, 전날 캐시로 플레이 중인 세션도 끝날 때까지 상세 정보를 읽을 수 있다.
+#   python daily_cache.py                       # 오늘 캐시 (이미 있으면 건너뜀)
+#   python daily_cache.py --regions kr us --force
+#   python daily_cache.py --schedule --lead 15  # 상주: 매일 자정 15분 전에 다음 날 캐시를 만든다
+REGIONS = {"kr": "₩", "us": "$", "jp": "¥"}
+CACHE_FILE_FMT = os.path.join(CACHE_DIR, "games_{date}_{cc}.cache")
+LEGACY_CACHE_FILE_FMT = os.path.join(APP_DIR, "today_games_{}.json")  # schema 1: 처음 읽을 때 새 형식으로 옮긴다
+TRACE_DIR = os.path.join(CACHE_DIR, "traces")
+CACHE_KEEP_DAYS = 2     # 이보다 오래된 날짜의 캐시 파일은 지운다
+RETRY_MINUTES = 10      # --schedule: 검색이 끊겨 캐시를 다 못 만들었으면 이만큼 뒤에 이어서 만든다
+LAZY_FIRST_PAGES = 2    # 앱의 지연 모드: 첫 화면은 검색 몇 페이지로 띄우고 나머지 창은 백그라운드에서 채운다
+
+_fills = {}             # date_str -> 창을 마저 채우는 백그라운드 스레드
+_fills_lock = threading.Lock()
+_builds = {}            # date_str -> 그 날짜 (모든 지역) 캐시를 만드는 동안 잡는 Lock
+
+def cache_path(cc, date_str):
+    return CACHE_FILE_FMT.format(date=date_str, cc=cc)
+
+def load_cached(cc, date_str):
+    # 그 날짜 캐시의 인덱스, 없거나 끊긴 크롤링으로 만든 것이면 None. 설명/스크린샷은 game_cache.read_detail 로 따로 읽는다
+    cached = load_index(cache_path(cc, date_str), LEGACY_CACHE_FILE_FMT.format(cc))
+    if cached and cached[0] == date_str and cached[1] and cached[2]:
+        count("cache_file_hit")
+        return cached[1]
+    count("cache_file_miss")
+    return None
+
+def build_caches(regions, date_str, progress=print, lazy=False, multi_region=True, page_limit=None):
+    # regions: [(cc, currency), ...] (첫 항목이 기준 지역) -> ({cc: 인덱스}, complete)
+    # 다음 날 캐시를 미리 만들 때는 그날 0시를 기준으로 출시 며칠째인지 센다
+    today = max(datetime.now(), datetime.strptime(date_str, "%Y-%m-%d"))
+    if multi_region:
+        # 기준 지역에서 검색/상세 정보를 한 번만 받고, 다른 지역은 가격만 받는다
+        trace = CrawlTrace("-".join(cc for cc, _ in regions))
+        results = fetch_all_regions(regions, progress=progress, trace=trace, lazy=lazy, today=today, page_limit=page_limit)
+    else:
+        trace = CrawlTrace(regions[0][0])
+        results = {regions[0][0]: fetch_steam_hidden_gems(*regions[0], progress=progress, trace=trace, lazy=lazy, today=today, page_limit=page_limit)}
+    # 기준 지역 검색이 재시도 끝에 끊겼거나 page_limit 에서 멈췄으면 체크포인트가 남아 있다: 그 캐시는 최종본으로 표시하지 않는다
+    with AppStore(APP_DB_FILE) as store:
+        complete = store.checkpoint(regions[0][0]) is None
+    with trace.stage("cache_write"):
+        for cc, games in results.items():
+            # 끊긴 크롤링으로 그날 이미 다 만든 캐시를 덮어쓰지 않는다
+            existing = None if complete else load_index(cache_path(cc, date_str))
+            if games and not (existing and existing[0] == date_str and existing[2]):
+                write_cache(cache_path(cc, date_str), date_str, games, complete)
+    trace.finish().write(TRACE_DIR)
+    publish(trace, results.keys())
+    prune_caches(date_str)
+    # 방금 쓴 파일의 인덱스를 돌려준다: 상세 정보는 메모리에 들고 있지 않는다
+    indexes = {}
+    for cc, games in results.items():
+        cached = load_index(cache_path(cc, date_str)) if games else None
+        indexes[cc] = cached[1] if cached else games
+    return indexes, complete
+
+def load_or_fetch_data(regions, date_str, force=False, progress=print, lazy=False, multi_region=True):
+    # 첫 지역의 (games, from_cache, complete). 캐시가 없거나 끊긴 크롤링으로 만든 것이거나 force 면 크롤링한다.
+    # lazy 면 검색 LAZY_FIRST_PAGES 페이지로 만든 풀을 먼저 돌려주고, 나머지 창은 백그라운드에서 이어서 크롤링해
+    # 캐시를 다시 쓴다 (다음 세션부터 전체 풀).
+    cc = regions[0][0]
+    if not force:
+        games = load_cached(cc, date_str)
+        if games: return games, True, True
+    with _fills_lock:
+        fill = _fills.get(date_str)
+        build = _builds.setdefault(date_str, threading.Lock())
+    if fill and fill.is_alive():
+        # 채우는 중에 크롤링을 또 시작하지 않는다: 지금까지 쓴 캐시로 버틴다
+        cached = load_index(cache_path(cc, date_str))
+        if cached and cached[1]: return cached[1], True, False
+
+    # 크롤링 한 번이 모든 지역 캐시를 쓴다: 다른 지역 세션이 같은 날짜를 만드는 중이면 기다렸다가 그 파일을 읽는다
+    waited = not build.acquire(blocking=False)
+    if waited:
+        count("cache_waited_for_build")
+        build.acquire()
+    try:
+        if waited:
+            cached = load_index(cache_path(cc, date_str))
+            if cached and cached[0] == date_str and cached[1]: return cached[1], True, cached[2]
+        indexes, complete = build_caches(regions, date_str, progress, lazy, multi_region, LAZY_FIRST_PAGES if lazy else None)
+        if lazy and not complete:
+            with _fills_lock:
+                if not (_fills.get(date_str) and _fills[date_str].is_alive()):
+                    _fills[date_str] = threading.Thread(target=fill_caches, args=(regions, date_str, lazy, multi_region),
+                                                        name=f"fill-{date_str}", daemon=True)
+                    _fills[date_str].start()
+        return indexes[cc], False, complete
+    finally:
+        build.release()
+
+def fill_caches(regions, date_str, lazy, multi_region):
+    # 체크포인트부터 창 끝까지 이어서 크롤링하고 캐시를 최종본으로 다시 쓴다
+    try: build_caches(regions, date_str, lambda msg: None, lazy, multi_region)
+    except Exception as e: print(f"⚠️ 백그라운드 크롤링 실패: {e!r}", file=sys.stderr)
+
+def prune_caches(date_str):
+    oldest = (datetime.strptime(date_str, "%Y-%m-%d") - timedelta(days=CACHE_KEEP_DAYS)).strftime("%Y-%m-%d")
+    for e in os.scandir(CACHE_DIR):
+        if e.name.startswith("games_") and e.name.endswith(".cache") and e.name[6:16] < oldest:
+            try: os.remove(e.path)
+            except OSError: pass
+
+def ensure_caches(regions, date_str, force=False, lazy=False, multi_region=True):
+    missing = regions if force else [(cc, cur) for cc, cur in regions if load_cached(cc, date_str) is None]
+    if not missing:
+        print(f"✅ {date_str} 캐시가 이미 있습니다: {', '.join(cc for cc, _ in regions)}")
+        return True
+    results, complete = build_caches(missing, date_str, lazy=lazy, multi_region=multi_region)
+    summary = ", ".join(f"{cc} {len(games)}개" for cc, games in results.items())
+    if complete: print(f"✅ {date_str} 캐시 완료: {summary}")
+    else: print(f"⚠️ {date_str} 검색이 중간에 끊겼습니다 (다음 실행 때 이어서 만듭니다): {summary}", file=sys.stderr)
+    return complete
+
+def run_schedule(regions, lead_minutes, lazy=False, multi_region=True):
+    # 깨어날 때마다 오늘 캐시를 확인하고, 자정 lead 분 전부터는 다음 날 캐시까지 만든다
+    lead = timedelta(minutes=lead_minutes)
+    while True:
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), dtime())
+        done = False
+        try:
+            done = ensure_caches(regions, now.strftime("%Y-%m-%d"), lazy=lazy, multi_region=multi_region)
+            if now >= midnight - lead:
+                done = ensure_caches(regions, midnight.strftime("%Y-%m-%d"), lazy=lazy, multi_region=multi_region) and done
+        except Exception as e:
+            print(f"⚠️ 캐시 만들기 실패: {e!r}", file=sys.stderr)
+        wake = midnight - lead if now < midnight - lead else midnight + timedelta(minutes=1)
+        # 실패했거나 끊긴 캐시는 자정까지 미루지 않고 곧 다시 시도한다 (끊긴 검색은 체크포인트부터 잇는다)
+        if not done: wake = min(wake, datetime.now() + timedelta(minutes=RETRY_MINUTES))
+        time.sleep(max(60.0, (wake - datetime.now()).total_seconds()))
+
+def main():
+    ap = argparse.ArgumentParser(description="날짜별 게임 캐시를 미리 만든다 (Streamlit 불필요)")
+    ap.add_argument("--regions", nargs="+", choices=list(REGIONS), default=list(REGIONS), help="첫 지역이 기준 지역")
+    ap.add_argument("--date", default=datetime.now().strftime("%Y-%m-%d"), help="만들 캐시의 날짜 (YYYY-MM-DD)")
+    ap.add_argument("--force", action="store_true", help="캐시가 있어도 다시 크롤링")
+    ap.add_argument("--lazy", action="store_true", help="상세 정보 없이 검색 행만 (플레이 중에 받는다)")
+    ap.add_argument("--single-region", action="store_true", help="지역마다 따로 크롤링")
+    ap.add_argument("--schedule", action="store_true", help="상주하면서 매일 자정 전에 다음 날 캐시를 만든다")
+    ap.add_argument("--lead", type=int, default=15, help="--schedule: 자정 몇 분 전에 만들지")
+    args = ap.parse_args()
+    regions = [(cc, REGIONS[cc]) for cc in args.regions]
+    if args.schedule:
+        run_schedule(regions, args.lead, args.lazy, not args.single_region)
+    elif args.single_region:
+        for r in regions: ensure_caches([r], args.date, args.force, args.lazy, False)
+    else:
+        ensure_caches(regions, args.date, args.force, args.lazy)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import os
+import re
+import json
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+# --- 오늘의 게임 캐시 파일 (schema 2) ---
+# 첫 줄: 헤더 JSON {"schema", "date", "written_at", "complete", "index": [...]}
+#   complete 가 false 면 검색이 중간에 끊긴 크롤링으로 만든 파일이다 (다음 로드 때 이어서 다시 만든다).
+#   index 항목은 목록/결과 화면에 필요한 필드만 담고, "detail": [상대 오프셋, 길이] 로 상세 레코드를 가리킨다.
+# 그 다음 줄부터: 게임마다 상세 레코드 한 줄 (설명, 장르, 스크린샷)
+# 인덱스는 바로 읽고, 상세 레코드는 게임을 화면에 띄울 때 오프셋으로 하나씩 읽는다.
+SCHEMA_VERSION = 2
+DETAIL_FIELDS = ("full_desc", "tags", "screenshots", "shot_thumbs")
+DEFAULT_DETAIL = {"full_desc": "설명 없음", "tags": "장르 미분류", "screenshots": [], "shot_thumbs": []}
+APP_ID_RE = re.compile(r'/apps?/(\d+)')
+
+def write_cache(path, date_str, games, complete=True):
+    # 임시 파일에 다 쓴 뒤 이름을 바꾼다: 읽는 쪽은 이전 파일이나 새 파일 중 하나만 본다
+    index, body, offset = [], [], 0
+    for g in games:
+        record = (json.dumps({"app_id": g.get("app_id"), **{k: g.get(k, DEFAULT_DETAIL[k]) for k in DETAIL_FIELDS}},
+                             ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        index.append({**{k: v for k, v in g.items() if k not in DETAIL_FIELDS and k != "detail"}, "detail": [offset, len(record)]})
+        body.append(record)
+        offset += len(record)
+    header = {"schema": SCHEMA_VERSION, "date": date_str, "written_at": datetime.now().isoformat(timespec="seconds"),
+              "complete": complete, "index": index}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # 세션/백그라운드 크롤링이 한 프로세스의 스레드라서 프로세스와 스레드 모두로 임시 파일을 나눈다
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write((json.dumps(header, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8"))
+        f.writelines(body)
+    os.replace(tmp, path)
+
+def read_index(path):
+    # (date, games, complete) 또는 None. 상세 레코드 위치는 파일 안의 절대 오프셋으로 바꿔 둔다
+    try:
+        with open(path, "rb") as f:
+            line = f.readline()
+        header = json.loads(line)
+    except (OSError, ValueError):
+        return None
+    if header.get("schema") != SCHEMA_VERSION: return None
+    games = [{**g, "detail": [len(line) + g["detail"][0], g["detail"][1]]} for g in header.get("index", [])]
+    return header.get("date"), games, header.get("complete", True)
+
+def migrate_legacy(legacy_path, path):
+    # schema 1 (통째로 된 JSON) 캐시를 새 형식으로 옮긴다. 다시 크롤링하지 않는다
+    try:
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return read_index(path)  # 다른 세션이 방금 옮겼을 수 있다
+    games = cached.get("games") or []
+    for g in games:
+        if not g.get("app_id"):
+            m = APP_ID_RE.search(g.get("img", ""))
+            g["app_id"] = int(m.group(1)) if m else None
+        g.setdefault("shot_thumbs", [])
+        g.setdefault("has_detail", True)
+    write_cache(path, cached.get("date"), games)
+    try: os.remove(legacy_path)
+    except FileNotFoundError: pass
+    return read_index(path)
+
+def load_index(path, legacy_path=None):
+    if not os.path.exists(path) and legacy_path and os.path.exists(legacy_path):
+        return migrate_legacy(legacy_path, path)
+    return read_index(path)
+
+@lru_cache(maxsize=512)
+def _read_record(path, stamp, offset, length):
+    # stamp (mtime_ns, inode): 같은 경로에 새로 쓴 파일의 레코드를 예전 캐시로 돌려주지 않는다
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return json.loads(f.read(length))
+
+def read_detail(path, app_id, ref):
+    # 파일이 그 사이 새로 쓰였으면 오프셋이 어긋난다: app_id 로 확인하고 인덱스를 다시 읽어 찾는다
+    for _ in range(2):
+        try:
+            st = os.stat(path)
+            record = _read_record(path, (st.st_mtime_ns, st.st_ino), *ref)
+            if record.get("app_id") == app_id: return record
+        except (OSError, ValueError, TypeError):
+            pass
+        loaded = read_index(path)
+        match = next((g for g in loaded[1] if g.get("app_id") == app_id), None) if loaded else None
+        if not match: break
+        ref = tuple(match["detail"])
+    return DEFAULT_DETAIL
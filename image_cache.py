@@ -0,0 +1,76 @@
+import os
+import io
+import hashlib
+import threading
+from PIL import Image
+
+# --- 로컬 이미지 캐시 (썸네일 + 용량 기준 LRU) ---
+# 헤더/스크린샷은 크롤링할 때 한 번만 받아 표시 폭에 맞게 줄여 디스크에 둔다.
+# 파일 mtime 을 마지막 사용 시각으로 쓰고, 전체 용량이 max_bytes 를 넘으면 오래된 것부터 지운다.
+class ImageCache:
+    def __init__(self, root, max_bytes):
+        self.root = os.path.abspath(root)  # 썸네일 경로를 절대 경로로 저장한다 (실행 위치가 달라도 열린다)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total = None
+
+    def path_for(self, url, width):
+        key = hashlib.sha1(f"{url}|{width}".encode("utf-8")).hexdigest()[:24]
+        return os.path.join(self.root, f"{key}.jpg")
+
+    def thumbnail(self, url, width, fetch):
+        # fetch(url) -> bytes. 실패하면 None (호출한 쪽에서 원격 주소를 쓴다)
+        path = self.path_for(url, width)
+        if self.touch(path): return path
+        try:
+            img = Image.open(io.BytesIO(fetch(url)))
+            img.thumbnail((width, width * 4))
+            buf = io.BytesIO()
+            img.convert("RGB").save(buf, "JPEG", quality=82, optimize=True)
+        except Exception:
+            return None
+        os.makedirs(self.root, exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f: f.write(buf.getvalue())
+        os.replace(tmp, path)
+        self._added(buf.tell())
+        return path
+
+    def touch(self, path):
+        try:
+            os.utime(path)
+            return True
+        except OSError:
+            return False
+
+    def _added(self, size):
+        with self.lock:
+            if self.total is None: self.total = self._scan_total()
+            else: self.total += size
+            if self.total > self.max_bytes: self._evict()
+
+    def _scan_total(self):
+        return sum(e.stat().st_size for e in os.scandir(self.root) if e.name.endswith(".jpg"))
+
+    def _evict(self):
+        # 가장 오래 안 쓴 파일부터 지워 용량의 90% 아래로 내린다
+        entries = sorted((e for e in os.scandir(self.root) if e.name.endswith(".jpg")), key=lambda e: e.stat().st_mtime)
+        total = sum(e.stat().st_size for e in entries)
+        for e in entries:
+            if total <= self.max_bytes * 0.9: break
+            size = e.stat().st_size
+            try:
+                os.remove(e.path)
+                total -= size
+            except OSError: pass
+        self.total = total
+
+def local_or_remote(path, url):
+    # 로컬 썸네일이 (아직) 있으면 그것을, 지워졌으면 원격 주소를 쓴다
+    if path and "://" in path: return path
+    if path:
+        try:
+            os.utime(path)
+            return path
+        except OSError: pass
+    return url
@@ -1,13 +1,17 @@
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
 import time
-import re
-import json
-import os
 import random
 import streamlit.components.v1 as components
 from datetime import datetime, timedelta
+from crawler import PREFETCH, PREFETCH_AHEAD
+from catalog import CATALOG
+from image_cache import local_or_remote
+from game_cache import read_detail
+from daily_cache import load_or_fetch_data, cache_path, TRACE_DIR
+from metrics import snapshot, latest_trace, observe_render, RENDER_BUDGET_MS
+from render import APP_CSS, game_card, result_tile, countdown_html
+
+render_t0 = time.perf_counter()  # 이번 rerun 의 렌더 시간 측정 시작
 
 # --- [중요] 페이지 설정 ---
 st.set_page_config(page_title="Steam Hunter", page_icon="🕵️", layout="wide")
@@ -18,6 +22,14 @@ REGION_CONFIG = {
     "USA (USD)":   {"code": "us", "symbol": "$", "budget": 50,    "flag": "🇺🇸"},
     "Japan (JPY)": {"code": "jp", "symbol": "¥", "budget": 7000,  "flag": "🇯🇵"},
 }
+MULTI_REGION_CRAWL = True   # 한 지역을 크롤링할 때 나머지 지역 캐시도 함께 만든다 (가격만 추가 요청)
+LAZY_DETAILS = True         # 크롤링은 검색 행만 모으고, 설명/스크린샷은 플레이 중에 미리 받는다
+DETAIL_POLL_SEC = 0.5       # 상세 정보를 기다릴 때 확인 주기
+LOADING_DETAIL = {"full_desc": "⏳ 상세 정보를 불러오는 중...", "tags": "…", "screenshots": [], "shot_thumbs": []}
+DECK_SIZE = 20              # 세션마다 후보 풀에서 뽑는 게임 수
+DECK_STRATA = {"가격대 고르게": "price", "평가 고르게": "tier", "출시 시기 고르게": "age", "장르 고르게": "tag"}
+GAME_SECONDS = 180
+TIMER_CHECK_SEC = 1         # 시간 초과 확인 주기 (타이머 조각만 다시 실행)
 
 # --- 사이드바: 국가 선택 ---
 with st.sidebar:
@@ -27,78 +39,28 @@ with st.sidebar:
     CC_CODE = current_config["code"]
     CURRENCY = current_config["symbol"]
     START_BUDGET = current_config["budget"]
-    CACHE_FILE = f"today_games_{CC_CODE}.json"
+    deck_strata = DECK_STRATA[st.selectbox("🃏 덱 구성 (다음 판부터)", list(DECK_STRATA.keys()), index=0)]
     
     st.caption(f"현재 스토어: {selected_region} ({current_config['flag']})")
     st.info("※ 이미지가 깨지거나 오류가 나면 '데이터 갱신' 버튼을 눌러주세요.")
 
+    # --- 크롤링 통계 ---
+    with st.expander("📊 크롤링 통계"):
+        stats = snapshot()
+        # 이 프로세스에서 크롤링하지 않았으면 (캐시를 cron/--schedule 이 만든 경우) 트레이스 파일에서 읽는다
+        last = stats["recent"].get(CC_CODE) or latest_trace(TRACE_DIR, CC_CODE)
+        if last:
+            st.caption(f"마지막 크롤링: {last['started_at']} · {last['wall_seconds']}초 · 요청 {sum(v for k, v in last['counters'].items() if k.startswith('requests_'))}회")
+            st.dataframe([{"단계": k, "초": v["seconds"], "횟수": v["calls"]} for k, v in last["stages"].items()], hide_index=True)
+            st.json(last, expanded=False)
+        else: st.caption("아직 크롤링 기록이 없습니다.")
+        st.json(stats["counters"], expanded=False)
+        rs = stats["render"]
+        if rs["runs"]:
+            st.caption(f"렌더: 직전 {st.session_state.get('render_ms', 0):.0f}ms · 평균 {rs['sum_ms'] / rs['runs']:.0f}ms · 최대 {rs['max_ms']:.0f}ms · 예산({RENDER_BUDGET_MS}ms) 초과 {rs['over_budget']}/{rs['runs']}회")
+
 # --- 커스텀 CSS ---
-st.markdown(f"""
-<style>
-    /* 가격 박스 */
-    .big-price-container {{
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        height: 100%;
-        width: 100%;
-        min-height: 100px;
-    }}
-    .big-price {{
-        font-size: 2.0rem !important;
-        font-weight: 800 !important;
-        color: #4CAF50 !important;
-        text-align: center;
-        background-color: #1b2838;
-        padding: 15px 20px;
-        border-radius: 12px;
-        border: 2px solid #4CAF50;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.3);
-    }}
-    /* 상단바 잔액 박스 (복구됨!) */
-    .top-balance-box {{
-        background-color: #1b2838;
-        border: 2px solid #4CAF50;
-        border-radius: 10px;
-        padding: 0;
-        text-align: center;
-        color: #4CAF50;
-        font-weight: 800;
-        font-size: 1.8rem;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.3);
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        align-items: center;
-        height: 100px;
-    }}
-    .top-label {{
-        font-size: 0.9rem;
-        color: #b0b0b0;
-        font-weight: normal;
-        margin-bottom: 2px;
-    }}
-    /* 게임 제목 (가독성) */
-    .game-title {{
-        font-size: 1.8rem !important;
-        font-weight: 800 !important;
-        margin-bottom: 8px !important;
-        line-height: 1.2 !important;
-        color: var(--text-color) !important; 
-    }}
-    /* 인벤토리 스타일 */
-    [data-testid="column"]:nth-of-type(2) [data-testid="stVerticalBlockBorderWrapper"] > div {{
-        background-color: #1b2838 !important; 
-        border: 1px solid #66c0f4 !important; 
-        border-radius: 8px !important;
-    }}
-    [data-testid="column"]:nth-of-type(2) [data-testid="stVerticalBlockBorderWrapper"] p,
-    [data-testid="column"]:nth-of-type(2) [data-testid="stVerticalBlockBorderWrapper"] span,
-    [data-testid="column"]:nth-of-type(2) [data-testid="stVerticalBlockBorderWrapper"] div {{
-        color: #e0e0e0 !important;
-    }}
-</style>
-""", unsafe_allow_html=True)
+st.markdown(APP_CSS, unsafe_allow_html=True)  # 프로세스에서 한 번 만든 CSS
 
 # --- 상태 초기화 ---
 if "gallery_open" not in st.session_state: st.session_state.gallery_open = False
@@ -107,14 +69,29 @@ if "last_region" not in st.session_state: st.session_state.last_region = CC_CODE
 
 if st.session_state.last_region != CC_CODE:
     st.session_state.money = START_BUDGET
-    st.session_state.inventory = []
+    st.session_state.owned = {}
     st.session_state.game_idx = 0
     st.session_state.start_time = None
     st.session_state.game_over = False
     st.session_state.last_region = CC_CODE
-    if "games" in st.session_state: del st.session_state["games"]
+    if "catalog" in st.session_state: del st.session_state["catalog"]
     st.rerun()
 
+# --- 타이머 감시 ---
+# 카운트다운 숫자는 브라우저(iframe 스크립트)에서 줄어들고, 서버는 이 조각만 주기적으로 다시 실행해
+# start_time 기준으로 시간 초과를 판정한다. 시간이 다 되면 그때만 전체 화면을 다시 그린다.
+@st.fragment(run_every=TIMER_CHECK_SEC)
+def watch_time_up():
+    if st.session_state.start_time and time.time() - st.session_state.start_time >= GAME_SECONDS:
+        st.session_state.game_over = True
+        st.rerun()
+
+# --- 상세 정보 대기 ---
+# 지연 모드에서 지금 게임의 상세 정보가 아직 없으면 이 조각만 주기적으로 돌면서 기다린다.
+@st.fragment(run_every=DETAIL_POLL_SEC)
+def wait_for_detail(cc, app_id):
+    if PREFETCH.get(cc, app_id) is not None: st.rerun()
+
 # --- 갤러리 다이얼로그 ---
 @st.dialog("📸 스크린샷 뷰어", width="large")
 def show_gallery_dialog(screenshots):
@@ -133,28 +110,6 @@ def show_gallery_dialog(screenshots):
         st.rerun()
 
 # --- 유틸리티 함수 ---
-def parse_date(date_str):
-    try: return datetime.strptime(re.sub(r'[년월일.\s]+', '-', date_str.strip()).strip('-'), "%Y-%m-%d")
-    except: pass
-    try: return datetime.strptime(date_str.replace(',', ''), "%b %d %Y")
-    except: pass
-    try: return datetime.strptime(date_str.replace(',', ''), "%d %b %Y")
-    except: return None
-
-def parse_price(price_text):
-    if "Free" in price_text or "무료" in price_text: return 0.0, f"{CURRENCY}0"
-    clean_num = re.sub(r'[^\d.]', '', price_text)
-    if not clean_num: return 0.0, f"{CURRENCY}0"
-    return float(clean_num), price_text
-
-def get_steam_tier_info(rating):
-    if rating >= 95: return "압도적으로 긍정적 💖", "blue", "#c5e8ff" 
-    elif rating >= 80: return "매우 긍정적 👍", "green", "#d9f7be" 
-    elif rating >= 70: return "대체로 긍정적 🙂", "green", "#f6ffed" 
-    elif rating >= 40: return "혼합 (Mixed) 😐", "orange", "#fff7e6" 
-    elif rating >= 20: return "대체로 부정적 👎", "red", "#fff1f0" 
-    else: return "매우/압도적으로 부정적 💔", "red", "#ffa39e" 
-
 def get_score_evaluation(score, budget):
     ratio = score / budget if budget > 0 else 0
     if ratio >= 8: return "👑 **게이브 뉴웰의 후계자** (완벽합니다! 당신의 지갑은 명작으로 가득 찼습니다.)"
@@ -163,133 +118,31 @@ def get_score_evaluation(score, budget):
     elif ratio >= 2: return "😐 **찍먹의 달인** (평범한 결과네요. 조금 더 과감한 투자가 필요합니다.)"
     else: return "💸 **환불 원정대** (지갑을 지키신 건가요? 게임을 좀 더 사보세요!)"
 
-def get_game_details(app_id):
-    url = "https://store.steampowered.com/api/appdetails"
-    try:
-        r = requests.get(url, params={"appids": app_id, "l": "korean", "cc": CC_CODE}, timeout=3)
-        data = r.json()
-        if str(app_id) in data and data[str(app_id)]['success']:
-            gd = data[str(app_id)]['data']
-            desc = re.sub('<[^<]+?>', '', gd.get('short_description', '설명 없음'))
-            tags = ", ".join([g['description'] for g in gd.get('genres', [])])
-            shots = [s.get('path_full', '') for s in gd.get('screenshots', [])]
-            return desc, tags, shots
-    except: pass
-    return "설명 없음", "장르 미분류", []
-
-# --- 크롤링 함수 (이미지 복구 강화) ---
-def fetch_steam_hidden_gems():
-    games = []
-    today = datetime.now()
+# --- 데이터 로드 ---
+# 크롤링/캐시는 daily_cache.py 가 맡는다. `python daily_cache.py --schedule` 을 돌려 두면
+# 자정 전에 다음 날 캐시가 만들어져 있어서 여기서 크롤링할 일이 없다.
+def load_region(date_str, force=False):
+    # 현재 지역이 기준 지역: 검색/상세 정보는 한 번만 받고, 다른 지역은 가격만 받는다
+    regions = [(CC_CODE, CURRENCY)] + [(c["code"], c["symbol"]) for c in REGION_CONFIG.values() if c["code"] != CC_CODE]
     status_text = st.empty()
-    status_text.info(f"🕵️ 스팀 탐색 시작... ({today.strftime('%Y-%m-%d')} 기준, 지역: {CC_CODE.upper()})")
-
-    base_url = "https://store.steampowered.com/search/results/"
-    cookies = {'Steam_Language': 'korean', 'birthtime': '0', 'lastagecheckage': '1-January-1990'}
-    headers = {"User-Agent": "Mozilla/5.0"}
-    
-    page = 0
-    while len(games) < 30 and page < 20: 
-        status_text.text(f"🔍 {page + 1}페이지 탐색 중... (확보: {len(games)}개)")
-        params = {"query": "", "start": page*25, "count": 25, "dynamic_data": "", "sort_by": "Released_DESC", "category1": "998", "infinite": "1", "cc": CC_CODE}
-        
-        try:
-            r = requests.get(base_url, params=params, headers=headers, cookies=cookies)
-            soup = BeautifulSoup(r.json().get('results_html', ''), 'html.parser')
-            rows = soup.select('a.search_result_row')
-            if not rows: break
-            
-            for row in rows:
-                if len(games) >= 20: break
-                title = row.select_one('.title').text.strip()
-                game_url = row.get('href', '')
-                app_id_match = re.search(r'/app/(\d+)', game_url)
-                if not app_id_match: continue
-                app_id = app_id_match.group(1)
-                
-                date_elem = row.select_one('.search_released')
-                if not date_elem: continue
-                game_date = parse_date(date_elem.text.strip())
-                if not game_date: continue
-                
-                days_diff = (today - game_date).days
-                if days_diff < 0 or days_diff > 35: continue # 35일 이내 신작만
-                
-                review_elem = row.select_one('.search_review_summary')
-                if not review_elem: continue
-                match = re.search(r'([\d,]+)', review_elem.get('data-tooltip-html', ''))
-                if not match: continue
-                review_count = int(match.group(1).replace(',', ''))
-                
-                if 10 <= review_count <= 2000:
-                    # [이미지 복구 로직] 1.srcset -> 2.src -> 3.Fallback
-                    img_tag = row.select_one('img')
-                    img_src = ""
-                    if img_tag:
-                        srcset = img_tag.get('srcset', '')
-                        if srcset:
-                            img_src = srcset.split(',')[0].strip().split(' ')[0]
-                        if not img_src or len(img_src) < 10:
-                            img_src = img_tag.get('src', '')
-                    
-                    # 그래도 없거나 이상하면 공식 CDN 주소 강제 할당
-                    if not img_src or len(img_src) < 10 or 'blank' in img_src:
-                        img_src = f"https://shared.akamai.steamstatic.com/store_item_assets/steam/apps/{app_id}/header.jpg"
-
-                    price_elem = row.select_one('.discount_final_price') or row.select_one('.search_price')
-                    raw_price = price_elem.text.strip() if price_elem else f"{CURRENCY}0"
-                    price_val, price_str = parse_price(raw_price)
-                    if price_val == 0: continue
-                    
-                    rating_match = re.search(r'(\d+)%', review_elem.get('data-tooltip-html', ''))
-                    rating = int(rating_match.group(1)) if rating_match else 0
-                    
-                    print(f"  ★ [확보] {title}")
-                    desc_text, tags_text, screenshots = get_game_details(app_id)
-                    
-                    games.append({
-                        "title": title, "price_str": price_str, "price_val": price_val, 
-                        "img": img_src,
-                        "thumb": img_src, # [KeyError 방지] thumb 키 명시적 추가
-                        "reviews": review_count, "rating": rating, 
-                        "desc": f"{date_elem.text.strip()} 출시 ({days_diff}일 전)", 
-                        "full_desc": desc_text, "tags": tags_text,
-                        "screenshots": screenshots
-                    })
-                    time.sleep(0.1)
-            page += 1
-            time.sleep(0.5)
-        except: break
+    result = load_or_fetch_data(regions, date_str, force, progress=status_text.text, lazy=LAZY_DETAILS, multi_region=MULTI_REGION_CRAWL)
     status_text.empty()
-    return games
-
-# --- 데이터 로드 ---
-def load_or_fetch_data():
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                cached = json.load(f)
-            if cached.get("date") == today_str and cached.get("games"):
-                return cached.get("games", []), True
-        except: pass
-    games = fetch_steam_hidden_gems()
-    if games:
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump({"date": today_str, "games": games}, f, ensure_ascii=False, indent=4)
-    return games, False
+    return result
 
 # --- 초기화 ---
-if "games" not in st.session_state:
+if "catalog" not in st.session_state:
     with st.spinner(f"🕵️ {selected_region} 스토어 탐색 중..."):
-        loaded_games, _ = load_or_fetch_data()
-        random.shuffle(loaded_games)
-        st.session_state.games = loaded_games
-        if not st.session_state.games: st.error("데이터 로드 실패."); st.stop()
+        # 공유 카탈로그는 읽기 전용: 세션은 게임 위치 순열만 섞어서 들고 있는다
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        catalog, _ = CATALOG.get(CC_CODE, today_str, lambda force: load_region(today_str, force))
+        if not catalog.games: st.error("데이터 로드 실패."); st.stop()
+        st.session_state.catalog = catalog
+        st.session_state.order = catalog.deal(random, DECK_SIZE, START_BUDGET, deck_strata)
+catalog, order = st.session_state.catalog, st.session_state.order
 
 if "money" not in st.session_state:
     st.session_state.money = START_BUDGET
-    st.session_state.inventory = []
+    st.session_state.owned = {}     # app_id -> None (구매 순서를 지키는 집합)
     st.session_state.game_idx = 0
     st.session_state.start_time = None
     st.session_state.game_over = False
@@ -299,68 +152,64 @@ if st.session_state.start_time is None:
     st.title("🕵️ Steam Hidden Gem Hunter")
     budget_fmt = f"{st.session_state.money:,.0f}" if CC_CODE in ['kr', 'jp'] else f"{st.session_state.money:.2f}"
     st.markdown(f"### {CURRENCY}{budget_fmt}로 3분 안에 최고의 인디 게임을 찾아라!")
-    st.info(f"🎮 분석된 후보 게임: {len(st.session_state.games)}개 (지역: {CC_CODE.upper()})")
+    st.info(f"🎮 분석된 후보 게임: {len(catalog)}개 중 {len(order)}개 (지역: {CC_CODE.upper()})")
     if st.button("🚀 사냥 시작", type="primary", width="stretch"):
         st.session_state.start_time = time.time()
         st.rerun()
 
 else:
     elapsed = time.time() - st.session_state.start_time
-    remaining = 180 - int(elapsed)
+    remaining = GAME_SECONDS - int(elapsed)
     
-    if remaining <= 0 or st.session_state.game_idx >= len(st.session_state.games):
+    if remaining <= 0 or st.session_state.game_idx >= len(order):
         st.session_state.game_over = True
         
     # --- 결과 화면 ---
     if st.session_state.game_over:
         st.title("🏁 최종 결과")
-        if not st.session_state.inventory: st.warning("구매 내역이 없습니다!")
+        inventory = [catalog.game(app_id) for app_id in st.session_state.owned]
+        if not inventory: st.warning("구매 내역이 없습니다!")
         else:
-            total = sum([g['price_val'] * (g['rating']/10) for g in st.session_state.inventory])
+            total = sum(catalog.score(app_id) for app_id in st.session_state.owned)
             st.subheader(f"🏆 최종 점수: :rainbow[{total:,.0f}점]")
             st.info(get_score_evaluation(total, START_BUDGET))
             st.divider()
             
-            # 티어별 출력
+            # 티어별 출력 (타일 HTML 은 게임별로 한 번만 만든다, 이미지는 로컬 썸네일)
             tier_groups = {"blue":[], "green":[], "orange":[], "red":[]}
             tier_titles = {"blue":"💖 압도적 긍정","green":"👍 긍정","orange":"😐 복합","red":"👎 부정"}
-            for g in st.session_state.inventory:
-                _, c, bg = get_steam_tier_info(g['rating'])
-                g['bg'] = bg; tier_groups[c].append(g)
+            for g in inventory:
+                c, tile = result_tile(CC_CODE, g)
+                tier_groups[c].append((g, tile))
             
             for c in ["blue","green","orange","red"]:
                 if tier_groups[c]:
                     st.markdown(f"### :{c}[{tier_titles[c]}]")
-                    for g in tier_groups[c]:
-                        st.markdown(f"""
-                        <div style="background-color:{g['bg']}; padding:15px; border-radius:10px; margin-bottom:10px; border:1px solid #ddd; color:#333;">
-                            <div style="display:flex; align-items:center;">
-                                <img src="{g['img']}" style="width:150px; border-radius:5px; margin-right:15px;">
-                                <div>
-                                    <h3 style="margin:0; font-size:1.2rem; color:#000;">{g['title']}</h3>
-                                    <p style="margin:0; font-weight:bold;">💵 {g['price_str']} | ⭐ {g['rating']}%</p>
-                                </div>
-                            </div>
-                        </div>""", unsafe_allow_html=True)
+                    for g, tile in tier_groups[c]:
+                        ci, ct = st.columns([1, 3], vertical_alignment="center")
+                        with ci: st.image(local_or_remote(g.thumb, g.img), width="stretch")
+                        with ct: st.markdown(tile, unsafe_allow_html=True)
         
         st.divider()
         c1, c2 = st.columns(2)
         if c1.button("🔄 다시 하기", width="stretch"):
             st.session_state.money = START_BUDGET
-            st.session_state.inventory = []
+            st.session_state.owned = {}
+            st.session_state.order = catalog.deal(random, DECK_SIZE, START_BUDGET, deck_strata)  # 새 덱
             st.session_state.game_idx = 0
             st.session_state.start_time = None
             st.session_state.game_over = False
             st.rerun()
         if c2.button("🆕 데이터 갱신", width="stretch"):
-            if os.path.exists(CACHE_FILE): os.remove(CACHE_FILE)
+            CATALOG.invalidate(CC_CODE)
+            PREFETCH.forget(CC_CODE)
             st.session_state.clear(); st.rerun()
 
     # --- 게임 진행 ---
     else:
         c1, c2, c3 = st.columns([1, 1, 1])
         with c1:
-            components.html(f"""<div style='background:#1b2838; border:2px solid #ff4b4b; border-radius:10px; text-align:center; color:#ff4b4b; font-weight:800; font-size:28px; height:96px; display:flex; flex-direction:column; justify-content:center; font-family:sans-serif;'><div style='font-size:14px; color:#b0b0b0; font-weight:normal;'>⏳ 남은 시간</div><div id='t'>{remaining}</div></div><script>var t={remaining},e=document.getElementById('t'),i=setInterval(()=>{{t<=0?(e.innerHTML='0',clearInterval(i)):e.innerHTML=t,t--}},1000)</script>""", height=100)
+            components.html(countdown_html(min(GAME_SECONDS, remaining)), height=100)
         with c2:
             m_fmt = f"{st.session_state.money:,.0f}" if CC_CODE in ['kr','jp'] else f"{st.session_state.money:.2f}"
             st.markdown(f"<div class='top-balance-box'><div class='top-label'>💰 현재 잔액</div><div>{CURRENCY}{m_fmt}</div></div>", unsafe_allow_html=True)
@@ -369,46 +218,59 @@ else:
             if st.button("🏳️ 조기 종료", width="stretch"):
                 st.session_state.game_over = True; st.rerun()
         
-        components.html(f"<script>setTimeout(function(){{window.location.reload();}}, 1000);</script>", height=0)
+        watch_time_up()
 
         st.divider()
         col_m, col_s = st.columns([3, 1])
         
         with col_s:
             st.subheader("🎒 인벤토리")
-            for i, item in enumerate(st.session_state.inventory):
+            for app_id in list(st.session_state.owned):
+                item = catalog.game(app_id)
                 with st.container(border=True):
-                    st.markdown(f"<div style='color:#66c0f4; font-weight:bold;'>{item['title']}</div>", unsafe_allow_html=True)
-                    # [KeyError 방지] thumb가 없으면 img 사용
-                    st.image(item.get('thumb', item['img']), width="stretch")
-                    if st.button("반품", key=f"ret_{i}", width="stretch"):
-                        st.session_state.inventory.remove(item)
-                        st.session_state.money += item['price_val']
+                    st.markdown(game_card(CC_CODE, item)[2], unsafe_allow_html=True)
+                    # thumb가 없으면 img 사용
+                    st.image(local_or_remote(item.thumb, item.img), width="stretch")
+                    if st.button("반품", key=f"ret_{app_id}", width="stretch"):
+                        del st.session_state.owned[app_id]
+                        st.session_state.money += item.price_val
                         st.rerun()
 
         with col_m:
-            game = st.session_state.games[st.session_state.game_idx]
-            is_owned = any(g['title'] == game['title'] for g in st.session_state.inventory)
+            game = catalog.games[order[st.session_state.game_idx]]
+            if game.has_detail: detail = read_detail(cache_path(catalog.cc, catalog.date), game.app_id, game.detail)
+            else:
+                # 지금 게임과 다음 몇 개의 상세 정보를 미리 받는다 (결과는 모든 세션이 공유)
+                upcoming = [catalog.games[i] for i in order[st.session_state.game_idx:st.session_state.game_idx + PREFETCH_AHEAD + 1]]
+                PREFETCH.want(CC_CODE, [g.app_id for g in upcoming if not g.has_detail])
+                detail = PREFETCH.get(CC_CODE, game.app_id)
+                if detail is None:
+                    wait_for_detail(CC_CODE, game.app_id)
+                    detail = LOADING_DETAIL
+            is_owned = game.app_id in st.session_state.owned
             
             with st.container(border=True):
+                title_html, price_html, _ = game_card(CC_CODE, game)
                 ci, cd, cp = st.columns([1.3, 2.7, 1], vertical_alignment="center")
-                with ci: st.image(game['img'], width="stretch") # 안전한 이미지 사용
+                with ci: st.image(local_or_remote(detail.get('thumb') or game.thumb, game.img), width="stretch") # 로컬 썸네일, 없으면 원격
                 with cd:
-                    st.markdown(f"<p class='game-title'>{game['title']}</p>", unsafe_allow_html=True)
+                    st.markdown(title_html, unsafe_allow_html=True)
                     if is_owned: st.success("✅ 보유 중")
-                    st.caption(f"📅 {game['desc']}")
-                    st.markdown(f"🏷️ {game['tags']}")
+                    st.caption(f"📅 {game.desc}")
+                    st.markdown(f"🏷️ {detail['tags']}")
                 with cp:
-                    st.markdown(f"<div class='big-price-container'><div class='big-price'>{game['price_str']}</div></div>", unsafe_allow_html=True)
+                    st.markdown(price_html, unsafe_allow_html=True)
             
-            st.info(f"📜 {game['full_desc']}")
+            st.info(f"📜 {detail['full_desc']}")
             
-            if game.get('screenshots'):
+            if detail.get('screenshots'):
                 st.markdown("##### 📸 스크린샷")
                 sc = st.columns(3)
-                for i, s in enumerate(game['screenshots'][:3]):
+                shot_thumbs = detail.get('shot_thumbs', [])
+                for i, s in enumerate(detail['screenshots'][:3]):
                     with sc[i]:
-                        st.image(s, width="stretch")
+                        # 스트립은 썸네일만, 원본은 갤러리를 열었을 때만 받는다
+                        st.image(local_or_remote(shot_thumbs[i] if i < len(shot_thumbs) else None, s), width="stretch")
                         if st.button("🔍 확대", key=f"z_{i}", width="stretch"):
                             st.session_state.gallery_idx = i; st.session_state.gallery_open = True; st.rerun()
 
@@ -419,20 +281,24 @@ else:
             
             if is_owned:
                 if b2.button("↩️ 환불하기", width="stretch"):
-                    st.session_state.inventory.remove(game)
-                    st.session_state.money += game['price_val']
+                    del st.session_state.owned[game.app_id]
+                    st.session_state.money += game.price_val
                     st.toast("환불 완료!"); st.rerun()
             else:
                 if b2.button("💸 구매하기", type="primary", width="stretch"):
-                    if st.session_state.money >= game['price_val']:
-                        st.session_state.money -= game['price_val']
-                        st.session_state.inventory.append(game)
+                    if st.session_state.money >= game.price_val:
+                        st.session_state.money -= game.price_val
+                        st.session_state.owned[game.app_id] = None
                         st.toast("구매 성공!"); st.rerun()
                     else: st.error("잔액 부족")
             
-            lbl = "결과 보기 🏁" if st.session_state.game_idx == len(st.session_state.games)-1 else "다음 ⏭️"
+            lbl = "결과 보기 🏁" if st.session_state.game_idx == len(order)-1 else "다음 ⏭️"
             if b3.button(lbl, width="stretch"):
                 st.session_state.game_idx += 1; st.rerun()
 
-            if st.session_state.gallery_open and game.get('screenshots'):
-                show_gallery_dialog(game['screenshots'])
\ No newline at end of file
+            if st.session_state.gallery_open and detail.get('screenshots'):
+                show_gallery_dialog(detail['screenshots'])
+
+# --- 렌더 시간 ---
+# 끝까지 그린 rerun 만 잰다 (st.rerun()/st.stop() 으로 끊긴 실행은 바로 이어지는 실행이 다시 그린다)
+st.session_state.render_ms = observe_render(time.perf_counter() - render_t0)
@@ -0,0 +1,128 @@
+import os
+import json
+import time
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+# --- 크롤링 계측 ---
+# 단계별 시간, 카운터, 요청 지연 히스토그램을 크롤링 한 번 단위(CrawlTrace)로 모으고,
+# 끝나면 JSON 트레이스 파일로 남긴다. 캐시 적중 같은 프로세스 전체 카운터는 count() 로 센다.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+TRACE_KEEP = 50         # 남겨 둘 트레이스 파일 수
+RENDER_BUDGET_MS = 50   # 화면 rerun 한 번의 스크립트 실행 시간 예산
+
+class CrawlTrace:
+    def __init__(self, name):
+        self.name = name
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.t0 = time.perf_counter()
+        self.lock = threading.Lock()
+        self.stages = defaultdict(lambda: {"seconds": 0.0, "calls": 0})
+        self.counters = defaultdict(int)
+        self.latency = {}
+        self.wall = None
+
+    @contextmanager
+    def stage(self, name):
+        t = time.perf_counter()
+        try: yield
+        finally: self.add_time(name, time.perf_counter() - t)
+
+    def add_time(self, name, seconds):
+        # 워커 스레드에서 들어온 시간은 합산된다 (벽시계 시간이 아님)
+        with self.lock:
+            self.stages[name]["seconds"] += seconds
+            self.stages[name]["calls"] += 1
+
+    def incr(self, key, n=1):
+        with self.lock: self.counters[key] += n
+
+    def observe(self, route, seconds):
+        ms = seconds * 1000
+        with self.lock:
+            h = self.latency.setdefault(route, {"count": 0, "sum_ms": 0.0, "max_ms": 0.0, "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1)})
+            h["count"] += 1
+            h["sum_ms"] += ms
+            h["max_ms"] = max(h["max_ms"], ms)
+            h["buckets"][next((i for i, b in enumerate(LATENCY_BUCKETS_MS) if ms <= b), len(LATENCY_BUCKETS_MS))] += 1
+
+    def finish(self):
+        self.wall = time.perf_counter() - self.t0
+        return self
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                "name": self.name, "started_at": self.started_at,
+                "wall_seconds": round(self.wall if self.wall is not None else time.perf_counter() - self.t0, 3),
+                "stages": {k: {"seconds": round(v["seconds"], 3), "calls": v["calls"]} for k, v in self.stages.items()},
+                "counters": dict(self.counters),
+                "latency_ms": {k: {**v, "sum_ms": round(v["sum_ms"], 1), "max_ms": round(v["max_ms"], 1), "bucket_bounds": list(LATENCY_BUCKETS_MS)}
+                               for k, v in self.latency.items()},
+            }
+
+    def write(self, directory):
+        # 임시 파일에 쓰고 이름을 바꿔서 반쯤 쓰인 트레이스가 보이지 않게 한다
+        os.makedirs(directory, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(directory, f"crawl_{self.name}_{stamp}.json")
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(f"{path}.tmp", path)
+        traces = sorted(e.path for e in os.scandir(directory) if e.name.startswith("crawl_") and e.name.endswith(".json"))
+        for old in traces[:-TRACE_KEEP]:
+            try: os.remove(old)
+            except OSError: pass
+        return path
+
+def latest_trace(directory, cc):
+    # 그 지역이 들어간 가장 최근 트레이스 파일 (dict), 없으면 None. 다른 프로세스 (daily_cache.py --schedule/cron) 가 쓴 것도 읽는다
+    try:
+        traces = [e for e in os.scandir(directory) if e.name.startswith("crawl_") and e.name.endswith(".json")
+                  and cc in e.name[len("crawl_"):].rsplit("_", 1)[0].split("-")]
+        newest = max(traces, key=lambda e: e.stat().st_mtime, default=None)
+        if newest is None: return None
+        with open(newest.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+class NullTrace:
+    # 계측이 필요 없을 때 쓰는 빈 트레이스
+    @contextmanager
+    def stage(self, name): yield
+    def add_time(self, name, seconds): pass
+    def incr(self, key, n=1): pass
+    def observe(self, route, seconds): pass
+
+NULL_TRACE = NullTrace()
+
+# --- 프로세스 전체 카운터 / 최근 트레이스 ---
+_lock = threading.Lock()
+COUNTERS = defaultdict(int)
+RECENT_TRACES = {}      # cc -> 마지막 크롤링 트레이스(dict)
+RENDER = {"runs": 0, "sum_ms": 0.0, "max_ms": 0.0, "over_budget": 0}
+
+def count(key, n=1):
+    with _lock: COUNTERS[key] += n
+
+def publish(trace, regions):
+    data = trace.to_dict()
+    with _lock:
+        for cc in regions: RECENT_TRACES[cc] = data
+    return data
+
+def observe_render(seconds):
+    # 화면 rerun 한 번의 실행 시간을 모으고 ms 로 돌려준다
+    ms = seconds * 1000
+    with _lock:
+        RENDER["runs"] += 1
+        RENDER["sum_ms"] += ms
+        RENDER["max_ms"] = max(RENDER["max_ms"], ms)
+        if ms > RENDER_BUDGET_MS: RENDER["over_budget"] += 1
+    return ms
+
+def snapshot():
+    with _lock: return {"counters": dict(COUNTERS), "recent": dict(RECENT_TRACES), "render": dict(RENDER)}
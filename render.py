@@ -0,0 +1,113 @@
+import html
+from functools import lru_cache
+from catalog import rating_tier
+
+# --- 화면 조각 캐시 ---
+# main.py 는 rerun 마다 처음부터 다시 실행된다. 바뀌지 않는 CSS 는 프로세스에서 한 번만 만들고,
+# 게임 카드/결과 타일 HTML 은 (지역, 게임) 단위로 기억해 둔다. 카탈로그 게임은 읽기 전용이고
+# 데이터를 갱신하면 새 객체가 되므로 기억해 둔 조각이 낡을 일이 없다.
+RENDER_CACHE_SIZE = 4096
+
+APP_CSS = """
+<style>
+    /* 가격 박스 */
+    .big-price-container {
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        height: 100%;
+        width: 100%;
+        min-height: 100px;
+    }
+    .big-price {
+        font-size: 2.0rem !important;
+        font-weight: 800 !important;
+        color: #4CAF50 !important;
+        text-align: center;
+        background-color: #1b2838;
+        padding: 15px 20px;
+        border-radius: 12px;
+        border: 2px solid #4CAF50;
+        box-shadow: 0 4px 10px rgba(0,0,0,0.3);
+    }
+    /* 상단바 잔액 박스 (복구됨!) */
+    .top-balance-box {
+        background-color: #1b2838;
+        border: 2px solid #4CAF50;
+        border-radius: 10px;
+        padding: 0;
+        text-align: center;
+        color: #4CAF50;
+        font-weight: 800;
+        font-size: 1.8rem;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.3);
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+        align-items: center;
+        height: 100px;
+    }
+    .top-label {
+        font-size: 0.9rem;
+        color: #b0b0b0;
+        font-weight: normal;
+        margin-bottom: 2px;
+    }
+    /* 게임 제목 (가독성) */
+    .game-title {
+        font-size: 1.8rem !important;
+        font-weight: 800 !important;
+        margin-bottom: 8px !important;
+        line-height: 1.2 !important;
+        color: var(--text-color) !important; 
+    }
+    /* 인벤토리 스타일 */
+    [data-testid="column"]:nth-of-type(2) [data-testid="stVerticalBlockBorderWrapper"] > div {
+        background-color: #1b2838 !important; 
+        border: 1px solid #66c0f4 !important; 
+        border-radius: 8px !important;
+    }
+    [data-testid="column"]:nth-of-type(2) [data-testid="stVerticalBlockBorderWrapper"] p,
+    [data-testid="column"]:nth-of-type(2) [data-testid="stVerticalBlockBorderWrapper"] span,
+    [data-testid="column"]:nth-of-type(2) [data-testid="stVerticalBlockBorderWrapper"] div {
+        color: #e0e0e0 !important;
+    }
+</style>
+"""
+
+# 등급 구간은 catalog.TIER_MIN_RATINGS (덱 색인과 같은 구간)
+TIER_INFO = [
+    ("압도적으로 긍정적 💖", "blue", "#c5e8ff"),
+    ("매우 긍정적 👍", "green", "#d9f7be"),
+    ("대체로 긍정적 🙂", "green", "#f6ffed"),
+    ("혼합 (Mixed) 😐", "orange", "#fff7e6"),
+    ("대체로 부정적 👎", "red", "#fff1f0"),
+    ("매우/압도적으로 부정적 💔", "red", "#ffa39e"),
+]
+
+def get_steam_tier_info(rating):
+    return TIER_INFO[rating_tier(rating)]
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def game_card(cc, game):
+    # (카드 제목, 가격 박스, 인벤토리 제목) HTML
+    title = html.escape(game.title)
+    return (f"<p class='game-title'>{title}</p>",
+            f"<div class='big-price-container'><div class='big-price'>{html.escape(game.price_str)}</div></div>",
+            f"<div style='color:#66c0f4; font-weight:bold;'>{title}</div>")
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def result_tile(cc, game):
+    # (티어 색, 결과 화면 타일 HTML). 이미지는 타일 옆에 st.image 로 로컬 썸네일을 띄운다
+    _, color, bg = get_steam_tier_info(game.rating)
+    return color, f"""
+                        <div style="background-color:{bg}; padding:15px; border-radius:10px; margin-bottom:10px; border:1px solid #ddd; color:#333;">
+                            <h3 style="margin:0; font-size:1.2rem; color:#000;">{html.escape(game.title)}</h3>
+                            <p style="margin:0; font-weight:bold;">💵 {html.escape(game.price_str)} | ⭐ {game.rating}%</p>
+                        </div>"""
+
+@lru_cache(maxsize=256)
+def countdown_html(remaining):
+    # 서버가 잰 남은 초를 받아 브라우저 자기 시계로 센다: 서버와 브라우저 시계가 어긋나도 숫자가 틀리지 않는다.
+    # 남은 초 (0 ~ GAME_SECONDS) 마다 한 벌씩만 만든다. 시간 초과 판정은 서버(watch_time_up)가 한다.
+    return f"""<div style='background:#1b2838; border:2px solid #ff4b4b; border-radius:10px; text-align:center; color:#ff4b4b; font-weight:800; font-size:28px; height:96px; display:flex; flex-direction:column; justify-content:center; font-family:sans-serif;'><div style='font-size:14px; color:#b0b0b0; font-weight:normal;'>⏳ 남은 시간</div><div id='t'></div></div><script>var d=Date.now()+{max(0, remaining) * 1000:.0f},e=document.getElementById('t');function f(){{var t=Math.max(0,Math.ceil((d-Date.now())/1000));e.innerHTML=t;if(t<=0)clearInterval(i)}}var i=setInterval(f,250);f()</script>"""
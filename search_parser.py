@@ -0,0 +1,122 @@
+import re
+import os
+import calendar
+from datetime import datetime
+from functools import lru_cache
+from html import unescape
+
+# --- 검색 결과 행 추출기 ---
+# /search/results/ 의 results_html 을 BeautifulSoup 없이 한 번 훑어서
+# 행마다 app_id, 제목, 출시일, 리뷰 수, 평가, 가격, 이미지, 태그 ID 를 뽑는다.
+ROW_RE = re.compile(r'<a\s([^>]*\bclass="[^"]*\bsearch_result_row\b[^"]*"[^>]*)>(.*?)</a>', re.S)
+HREF_RE = re.compile(r'\bhref="([^"]*)"')
+APP_ID_RE = re.compile(r'/app/(\d+)')
+TAGIDS_RE = re.compile(r'\bdata-ds-tagids="\[([^\]]*)\]"')
+# 패턴은 가능한 한 클래스 이름(리터럴)으로 시작하게 해서 정규식 엔진이 빠르게 건너뛰도록 한다
+TITLE_RE = re.compile(r'class="title"[^>]*>(.*?)<', re.S)
+RELEASED_RE = re.compile(r'search_released\b[^"]*"[^>]*>(.*?)</div>', re.S)
+TOOLTIP_RE = re.compile(r'\bdata-tooltip-html="([^"]*)"')
+IMG_TAG_RE = re.compile(r'<img\s[^>]*>')
+SRCSET_RE = re.compile(r'\bsrcset="([^"]*)"')
+SRC_RE = re.compile(r'\bsrc="([^"]*)"')
+FINAL_PRICE_RE = re.compile(r'discount_final_price\b[^"]*"[^>]*>(.*?)</div>', re.S)
+SEARCH_PRICE_RE = re.compile(r'<div[^>]*\bclass="[^"]*\bsearch_price\b[^"]*"[^>]*>(.*?)</div>', re.S)
+TAG_RE = re.compile(r'<[^>]+>')
+COUNT_RE = re.compile(r'([\d,]+)')
+PERCENT_RE = re.compile(r'(\d+)%')
+PRICE_NUM_RE = re.compile(r'[^\d.]')
+CDN_URL = os.environ.get("STEAM_CDN_URL", "https://shared.akamai.steamstatic.com")
+
+DATE_SEP_RE = re.compile(r'[년월일.\s]+')
+YMD_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+MDY_RE = re.compile(r'([A-Za-z]{3})\s+(\d{1,2})\s+(\d{4})')
+DMY_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})')
+MONTHS = {m.lower(): i for i, m in enumerate(calendar.month_abbr) if m}
+
+def _tag_containing(body, needle):
+    # needle 이 들어 있는 태그 전체 (속성 순서와 무관)
+    i = body.find(needle)
+    if i < 0: return None
+    return body[body.rfind('<', 0, i):body.find('>', i) + 1]
+
+def _text(fragment):
+    return unescape(TAG_RE.sub('', fragment)).strip()
+
+def _make_date(y, m, d):
+    try: return datetime(int(y), int(m), int(d))
+    except ValueError: return None
+
+# 같은 날짜 문자열이 수백 번 반복되므로 결과를 문자열 단위로 기억한다
+@lru_cache(maxsize=4096)
+def parse_date(date_str):
+    # 2024년 10월 15일 / 2024. 10. 15. / 2024-10-15
+    m = YMD_RE.fullmatch(DATE_SEP_RE.sub('-', date_str.strip()).strip('-'))
+    if m: return _make_date(*m.groups())
+    plain = date_str.replace(',', '')
+    # Oct 15, 2024
+    m = MDY_RE.fullmatch(plain)
+    if m and m.group(1).lower() in MONTHS: return _make_date(m.group(3), MONTHS[m.group(1).lower()], m.group(2))
+    # 15 Oct, 2024
+    m = DMY_RE.fullmatch(plain)
+    if m and m.group(2).lower() in MONTHS: return _make_date(m.group(3), MONTHS[m.group(2).lower()], m.group(1))
+    return None
+
+def parse_price(price_text, currency):
+    if "Free" in price_text or "무료" in price_text: return 0.0, f"{currency}0"
+    clean_num = PRICE_NUM_RE.sub('', price_text)
+    if not clean_num: return 0.0, f"{currency}0"
+    return float(clean_num), price_text
+
+def parse_search_rows(results_html, currency):
+    # 필수 필드(app_id, 제목, 출시일, 리뷰)가 없는 행은 건너뛴다
+    for m in ROW_RE.finditer(results_html):
+        attrs, body = m.group(1), m.group(2)
+        href = HREF_RE.search(attrs)
+        app_id_match = APP_ID_RE.search(unescape(href.group(1))) if href else None
+        if not app_id_match: continue
+        app_id = app_id_match.group(1)
+
+        title_match = TITLE_RE.search(body)
+        if not title_match: continue
+
+        date_match = RELEASED_RE.search(body)
+        if not date_match: continue
+        date_text = _text(date_match.group(1))
+        release_date = parse_date(date_text)
+        if not release_date: continue
+
+        review_tag = _tag_containing(body, 'search_review_summary')
+        if not review_tag: continue
+        tooltip = TOOLTIP_RE.search(review_tag)
+        tooltip = unescape(tooltip.group(1)) if tooltip else ''
+        count_match = COUNT_RE.search(tooltip)
+        if not count_match: continue
+        rating_match = PERCENT_RE.search(tooltip)
+
+        # [이미지 복구 로직] 1.srcset -> 2.src -> 3.Fallback
+        img_src = ""
+        img_tag = IMG_TAG_RE.search(body)
+        if img_tag:
+            srcset = SRCSET_RE.search(img_tag.group(0))
+            if srcset and srcset.group(1):
+                img_src = unescape(srcset.group(1)).split(',')[0].strip().split(' ')[0]
+            if not img_src or len(img_src) < 10:
+                src = SRC_RE.search(img_tag.group(0))
+                img_src = unescape(src.group(1)) if src else ''
+        # 그래도 없거나 이상하면 공식 CDN 주소 강제 할당
+        if not img_src or len(img_src) < 10 or 'blank' in img_src:
+            img_src = f"{CDN_URL}/store_item_assets/steam/apps/{app_id}/header.jpg"
+
+        price_match = FINAL_PRICE_RE.search(body) or SEARCH_PRICE_RE.search(body)
+        raw_price = _text(price_match.group(1)) if price_match else f"{currency}0"
+        price_val, price_str = parse_price(raw_price, currency)
+        tag_ids = TAGIDS_RE.search(attrs)
+        tag_ids = list(dict.fromkeys(int(t) for t in tag_ids.group(1).split(',') if t.strip().isdigit())) if tag_ids else []
+
+        yield {
+            "app_id": int(app_id), "title": _text(title_match.group(1)),
+            "date_text": date_text, "release_date": release_date,
+            "reviews": int(count_match.group(1).replace(',', '')),
+            "rating": int(rating_match.group(1)) if rating_match else 0,
+            "price_val": price_val, "price_str": price_str, "img": img_src, "tag_ids": tag_ids,
+        }